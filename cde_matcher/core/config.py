@@ -6,29 +6,51 @@ with sensible defaults for all deployment scenarios.
 """
 
 import os
+import functools
 from typing import Optional
 from dataclasses import dataclass
 
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'cde_matcher')
+
 
 @dataclass
 class Config:
     """
-    Application configuration with environment variable defaults.
+    Application configuration.
 
-    All configuration is loaded from environment variables with sensible defaults.
-    This provides a single source of truth for all application settings.
+    Use Config.from_env() (or the cached get_config()) to load settings from
+    environment variables; the field defaults are the values used when a
+    variable is unset. This provides a single source of truth for all
+    application settings.
     """
 
     # Server settings
-    port: int = int(os.getenv('PORT', '8080'))
+    port: int = 8080
 
     # Data storage configuration
-    local_mode: bool = os.getenv('CDE_LOCAL_MODE', 'false').lower() == 'true'
-    gcs_bucket: str = os.getenv('CDE_GCS_BUCKET', 'pathnd_cdes')
-    gcs_project: Optional[str] = os.getenv('CDE_GCS_PROJECT')
+    local_mode: bool = False
+    gcs_bucket: str = 'pathnd_cdes'
+    gcs_project: Optional[str] = None
+    gcs_download_workers: int = 8
+
+    # Local cache for Parquet copies of GCS CSV objects
+    cache_dir: str = _DEFAULT_CACHE_DIR
 
     # Authentication settings
-    password_hash: Optional[str] = os.getenv('CDE_PASSWORD_HASH')
+    password_hash: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> 'Config':
+        """Create a configuration from the current environment variables."""
+        return cls(
+            port=int(os.getenv('PORT', str(cls.port))),
+            local_mode=os.getenv('CDE_LOCAL_MODE', 'false').lower() == 'true',
+            gcs_bucket=os.getenv('CDE_GCS_BUCKET', cls.gcs_bucket),
+            gcs_project=os.getenv('CDE_GCS_PROJECT'),
+            gcs_download_workers=int(os.getenv('CDE_GCS_CONCURRENCY', str(cls.gcs_download_workers))),
+            cache_dir=os.getenv('CDE_CACHE_DIR', cls.cache_dir),
+            password_hash=os.getenv('CDE_PASSWORD_HASH')
+        )
 
     @property
     def data_paths(self) -> dict:
@@ -75,5 +97,18 @@ class Config:
         )
 
 
-# Global configuration instance
-config = Config()
\ No newline at end of file
+@functools.cache
+def get_config() -> Config:
+    """
+    Get the global configuration, reading environment variables on first use.
+
+    Call ``get_config.cache_clear()`` after changing the environment to reload it.
+    """
+    return Config.from_env()
+
+
+def __getattr__(name: str):
+    """Resolve the legacy module attribute ``config`` to get_config()."""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
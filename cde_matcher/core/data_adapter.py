@@ -6,12 +6,53 @@ Provides transparent access to data whether stored locally or in GCS buckets.
 
 import pandas as pd
 import os
+import time
 from pathlib import Path
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Any, Iterator, Tuple
+import csv
+import json
 import tempfile
-import glob
+import fnmatch
+import hashlib
+import mmap
+import threading
+from contextlib import contextmanager
 
-from .config import config
+from .config import get_config
+
+# Chunk size for GCS object transfers (a multiple of 256 KiB, as GCS requires)
+GCS_CHUNK_SIZE = 32 * 1024 * 1024
+
+# GCS objects larger than this are downloaded with parallel ranged requests
+GCS_PARALLEL_DOWNLOAD_THRESHOLD = 128 * 1024 * 1024
+
+# Seconds a GCS prefix listing is reused for existence checks and file lists
+GCS_LISTING_TTL = 30
+
+# Block size for pyarrow's multi-threaded CSV reader (each block is parsed by one thread)
+CSV_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Cell values pyarrow's CSV reader treats as missing: pd.read_csv's documented
+# default NA set (pyarrow's own defaults omit e.g. 'None', which pandas reads as NaN)
+CSV_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+# Magnitude from which integers no longer fit int64; pyarrow reads such
+# columns as float64, losing digits
+INT64_BOUND = 2 ** 63
+
+# pd.read_csv options for CSV files with a known layout, by file name. Declaring
+# the types up front skips the type inference pass over every column.
+CSV_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    # DigiPath CDE reference table: every column is text
+    'digipath_cdes.csv': {'dtype': str},
+}
+
+# Parquet schema metadata key holding the CSV_SCHEMAS dtype a Parquet copy was
+# written with, so copies made before a schema change are rewritten
+PARQUET_DTYPE_KEY = b'cde_matcher.csv_dtype'
 
 
 class DataAdapter:
@@ -26,15 +67,12 @@ class DataAdapter:
         """
         self.gcs_project_id = gcs_project_id
         self._gcs_client = None
+        self._gcs_listings: Dict[Tuple[str, str], Tuple[float, Dict[str, float]]] = {}
 
     def _get_gcs_client(self):
-        """Get or create GCS client."""
+        """Get the process-wide GCS client for this adapter's project."""
         if self._gcs_client is None:
-            try:
-                from google.cloud import storage
-                self._gcs_client = storage.Client(project=self.gcs_project_id)
-            except ImportError:
-                raise ImportError("google-cloud-storage not installed. Run: pip install google-cloud-storage")
+            self._gcs_client = _get_shared_gcs_client(self.gcs_project_id)
         return self._gcs_client
 
     def _is_gcs_path(self, path: str) -> bool:
@@ -52,39 +90,284 @@ class DataAdapter:
 
         return bucket_name, object_name
 
-    def read_csv(self, path: str) -> pd.DataFrame:
+    def read_csv(self,
+                 path: str,
+                 columns: Optional[List[str]] = None,
+                 nrows: Optional[int] = None) -> pd.DataFrame:
         """
         Read CSV file from local filesystem or GCS bucket.
 
+        Local CSVs are read through a Parquet copy stored next to the file
+        (see ensure_parquet) when pyarrow is available. Files listed in
+        CSV_SCHEMAS are parsed with their declared types.
+
         Args:
             path: Local file path or GCS bucket path (gs://bucket/path)
+            columns: Subset of columns to load (None for all columns)
+            nrows: Number of leading rows to read (None for all rows)
 
         Returns:
             DataFrame with loaded data
         """
         if self._is_gcs_path(path):
-            return self._read_csv_from_gcs(path)
-        else:
-            return pd.read_csv(path)
+            return self._read_csv_from_gcs(path, columns=columns, nrows=nrows)
+
+        if nrows is not None:
+            # Reading a few leading rows is cheaper straight from the CSV
+            return pd.read_csv(path, usecols=columns, nrows=nrows, dtype=_csv_dtype(path))
+
+        parquet_path = self.ensure_parquet(path)
+        if parquet_path is not None:
+            return pd.read_parquet(parquet_path, columns=columns)
+        return _read_csv_file(path, columns, dtype=_csv_dtype(path))
+
+    def ensure_parquet(self, csv_path: str) -> Optional[str]:
+        """
+        Create or refresh a Parquet copy of a local CSV file.
+
+        The copy is written next to the CSV (``data.csv`` -> ``data.parquet``)
+        and rewritten whenever the CSV is newer than it or its CSV_SCHEMAS
+        entry has changed since it was written.
+
+        Args:
+            csv_path: Local CSV file path
+
+        Returns:
+            Path to the Parquet file, or None if it cannot be used
+            (pyarrow not installed, unwritable directory, or unconvertible data)
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None
+
+        parquet_path = str(Path(csv_path).with_suffix('.parquet'))
+
+        dtype = _csv_dtype(csv_path)
+        if (os.path.exists(parquet_path) and
+                os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path) and
+                _parquet_dtype_matches(parquet_path, dtype)):
+            return parquet_path
+
+        try:
+            _write_parquet_atomically(_read_csv_file(csv_path, dtype=dtype), parquet_path, dtype)
+        except Exception:
+            # Mixed-type columns or read-only data directory: fall back to CSV
+            return None
+
+        return parquet_path
+
+    def read_csv_chunks(self,
+                        path: str,
+                        columns: Optional[List[str]] = None,
+                        chunksize: int = 100_000,
+                        dtype: Optional[Any] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in chunks so memory stays bounded by the chunk size.
+
+        Args:
+            path: Local file path or GCS bucket path (gs://bucket/path)
+            columns: Subset of columns to load (None for all columns)
+            chunksize: Number of rows per chunk
+            dtype: Data type(s) passed to pd.read_csv (e.g. str to skip inference;
+                   None uses the file's CSV_SCHEMAS entry, if any)
+
+        Yields:
+            DataFrame chunks of at most chunksize rows
+        """
+        if dtype is None:
+            dtype = _csv_dtype(path)
+
+        if self._is_gcs_path(path):
+            with _gcs_not_found_as_error(path), self._gcs_blob(path).open('rb') as f:
+                yield from pd.read_csv(f, usecols=columns, chunksize=chunksize, dtype=dtype)
+            return
+
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize, dtype=dtype)
+
+    def read_csv_metadata(self, path: str, preview_rows: int = 10,
+                          include_row_count: bool = True) -> Dict[str, Any]:
+        """
+        Read CSV structure without loading the full dataset.
+
+        Args:
+            path: Local file path or GCS bucket path (gs://bucket/path)
+            preview_rows: Number of leading rows to include as a preview
+            include_row_count: Whether to count data rows (requires a pass over the file)
 
-    def _read_csv_from_gcs(self, gcs_path: str) -> pd.DataFrame:
-        """Read CSV file from GCS bucket."""
+        Returns:
+            Dictionary with 'columns', 'dtypes' (inferred from the preview rows),
+            'preview' (DataFrame of leading rows), 'n_rows' (None if not counted)
+            and 'file_size_mb'
+        """
+        preview = self.read_csv(path, nrows=preview_rows)
+
+        return {
+            'columns': list(preview.columns),
+            'dtypes': preview.dtypes.astype(str).to_dict(),
+            'preview': preview,
+            'n_rows': self.count_rows(path) if include_row_count else None,
+            'file_size_mb': self.get_file_size(path) / 1024 / 1024
+        }
+
+    def count_rows(self, path: str) -> int:
+        """
+        Count data rows in a CSV file without materializing it.
+
+        Uses Parquet metadata for local files when available, otherwise
+        streams a single column through the CSV parser.
+
+        Args:
+            path: Local file path or GCS bucket path (gs://bucket/path)
+
+        Returns:
+            Number of data rows (excluding the header)
+        """
+        if self._is_gcs_path(path):
+            return sum(len(chunk) for chunk in self.read_csv_chunks(path, columns=[0]))
+
+        parquet_path = self.ensure_parquet(path)
+        if parquet_path is not None:
+            import pyarrow.parquet as pq
+            return pq.ParquetFile(parquet_path).metadata.num_rows
+
+        return sum(len(chunk) for chunk in pd.read_csv(path, usecols=[0], chunksize=100_000))
+
+    def _gcs_blob(self, gcs_path: str):
+        """Get a blob handle for a GCS path, transferring data in GCS_CHUNK_SIZE chunks."""
         bucket_name, object_name = self._parse_gcs_path(gcs_path)
 
         client = self._get_gcs_client()
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(object_name)
+        blob.chunk_size = GCS_CHUNK_SIZE
+        return blob
+
+    def _get_gcs_blob(self, gcs_path: str):
+        """
+        Get the blob for an existing GCS object, with its metadata (e.g. size) loaded.
 
-        if not blob.exists():
+        Raises:
+            FileNotFoundError: If the GCS object does not exist
+        """
+        bucket_name, object_name = self._parse_gcs_path(gcs_path)
+
+        blob = self._get_gcs_client().bucket(bucket_name).get_blob(object_name)
+        if blob is None:
             raise FileNotFoundError(f"GCS object not found: {gcs_path}")
 
-        # Download to temporary file
-        with tempfile.NamedTemporaryFile(mode='w+b', delete=False, suffix='.csv') as temp_file:
-            blob.download_to_filename(temp_file.name)
-            df = pd.read_csv(temp_file.name)
-            os.unlink(temp_file.name)  # Clean up temp file
+        blob.chunk_size = GCS_CHUNK_SIZE
+        return blob
+
+    def _read_csv_from_gcs(self, gcs_path: str,
+                           columns: Optional[List[str]] = None,
+                           nrows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Read CSV file from GCS bucket.
 
-        return df
+        The object is streamed into the CSV parser as it downloads, without a
+        temporary file; with nrows only the leading part of the object is fetched.
+        Objects larger than GCS_PARALLEL_DOWNLOAD_THRESHOLD are read in full
+        with parallel ranged downloads instead.
+
+        Full reads are cached as Parquet files in config.cache_dir, keyed by the
+        object's generation, so an unchanged object is only downloaded once
+        (unless its CSV_SCHEMAS entry changes).
+        """
+        if nrows is not None:
+            # No metadata request: a missing object surfaces on the first ranged read
+            with _gcs_not_found_as_error(gcs_path), self._gcs_blob(gcs_path).open('rb') as f:
+                return pd.read_csv(f, usecols=columns, nrows=nrows, dtype=_csv_dtype(gcs_path))
+
+        # Full reads need the size and generation, so fetch the object's metadata
+        blob = self._get_gcs_blob(gcs_path)
+
+        cache_path = self._gcs_parquet_cache_path(blob)
+        if cache_path is None:
+            return self._download_csv_from_gcs(blob, columns)
+        dtype = _csv_dtype(gcs_path)
+        if os.path.exists(cache_path) and _parquet_dtype_matches(cache_path, dtype):
+            return pd.read_parquet(cache_path, columns=columns)
+
+        df = self._download_csv_from_gcs(blob)
+        self._write_gcs_parquet_cache(df, cache_path, dtype)
+        return df[columns] if columns is not None else df
+
+    def _download_csv_from_gcs(self, blob, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Download and parse a full GCS CSV object (in parallel if it is large)."""
+        if blob.size is not None and blob.size > GCS_PARALLEL_DOWNLOAD_THRESHOLD:
+            df = self._read_large_csv_from_gcs(blob, columns)
+            if df is not None:
+                return df
+
+        with blob.open('rb') as f:
+            return pd.read_csv(f, usecols=columns, dtype=_csv_dtype(blob.name))
+
+    def _gcs_parquet_cache_path(self, blob) -> Optional[str]:
+        """
+        Get the local Parquet cache path for the current generation of a GCS object.
+
+        Returns:
+            Cache file path (which may not exist yet), or None if pyarrow is not installed
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None
+
+        object_key = hashlib.sha1(f"{blob.bucket.name}/{blob.name}".encode()).hexdigest()
+        return os.path.join(get_config().cache_dir, f"{object_key}_{blob.generation}.parquet")
+
+    def _write_gcs_parquet_cache(self, df: pd.DataFrame, cache_path: str, dtype: Any = None) -> None:
+        """
+        Write a Parquet cache file, removing copies of older generations of the object.
+
+        Failures (unwritable cache directory, unconvertible data) are ignored;
+        the object is then simply downloaded again next time.
+        """
+        object_key = os.path.basename(cache_path).split('_', 1)[0]
+
+        try:
+            os.makedirs(get_config().cache_dir, exist_ok=True)
+            _write_parquet_atomically(df, cache_path, dtype)
+
+            with os.scandir(get_config().cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(f"{object_key}_") and entry.path != cache_path:
+                        os.unlink(entry.path)
+        except Exception:
+            pass
+
+    def _read_large_csv_from_gcs(self, blob, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Download a large GCS object with concurrent ranged requests, then parse it.
+
+        A single stream cannot use the full network bandwidth for very large
+        objects, so chunks are fetched by config.gcs_download_workers workers
+        (CDE_GCS_CONCURRENCY) into a temporary file.
+
+        Args:
+            blob: Blob of an existing GCS object
+            columns: Subset of columns to load (None for all columns)
+
+        Returns:
+            DataFrame with loaded data, or None if the installed
+            google-cloud-storage has no transfer manager
+        """
+        try:
+            from google.cloud.storage.transfer_manager import download_chunks_concurrently
+        except ImportError:
+            return None
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, os.path.basename(blob.name))
+            download_chunks_concurrently(
+                blob,
+                temp_path,
+                chunk_size=GCS_CHUNK_SIZE,
+                max_workers=get_config().gcs_download_workers
+            )
+            return _read_csv_file(temp_path, columns, dtype=_csv_dtype(blob.name))
 
     def list_files(self, path: str, pattern: str = "*.csv") -> List[str]:
         """
@@ -103,33 +386,56 @@ class DataAdapter:
             return self._list_local_files(path, pattern)
 
     def _list_local_files(self, directory: str, pattern: str = "*.csv") -> List[str]:
-        """List local files matching pattern."""
-        if not os.path.exists(directory):
+        """List local files matching pattern, sorted by name like GCS listings."""
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
             return []
 
-        full_pattern = os.path.join(directory, pattern)
-        files = glob.glob(full_pattern)
-        return [os.path.basename(f) for f in files]
+        # DirEntry.is_file() uses the type from the directory listing, so no per-file stat
+        with entries:
+            return sorted(entry.name for entry in entries
+                          if entry.is_file() and not entry.name.startswith('.')
+                          and fnmatch.fnmatch(entry.name, pattern))
+
+    def _gcs_objects(self, bucket_name: str, prefix: str) -> Dict[str, float]:
+        """
+        Get the names and modification times of all objects under a GCS prefix.
+
+        The listing takes a single request and is reused for GCS_LISTING_TTL
+        seconds, so checking many files for existence or modification costs
+        one round trip.
+
+        Args:
+            bucket_name: GCS bucket name
+            prefix: Object name prefix
+
+        Returns:
+            Dictionary mapping full object names to modification times (POSIX timestamps)
+        """
+        key = (bucket_name, prefix)
+        cached = self._gcs_listings.get(key)
+        if cached is not None and time.monotonic() - cached[0] < GCS_LISTING_TTL:
+            return cached[1]
+
+        blobs = self._get_gcs_client().bucket(bucket_name).list_blobs(prefix=prefix)
+        objects = {blob.name: blob.updated.timestamp() for blob in blobs}
+        self._gcs_listings[key] = (time.monotonic(), objects)
+        return objects
 
     def _list_gcs_files(self, gcs_path: str, pattern: str = "*.csv") -> List[str]:
         """List files in GCS bucket with prefix."""
         bucket_name, prefix = self._parse_gcs_path(gcs_path)
 
-        client = self._get_gcs_client()
-        bucket = client.bucket(bucket_name)
-
         # Ensure prefix ends with / if it should be a directory
         if prefix and not prefix.endswith('/'):
             prefix += '/'
 
-        # List blobs with prefix
-        blobs = bucket.list_blobs(prefix=prefix)
-
         files = []
-        for blob in blobs:
+        for name in sorted(self._gcs_objects(bucket_name, prefix)):
             # Only include files (not directories) that match pattern
-            if not blob.name.endswith('/'):
-                filename = os.path.basename(blob.name)
+            if not name.endswith('/'):
+                filename = os.path.basename(name)
                 if pattern == "*.csv" and filename.endswith('.csv'):
                     files.append(filename)
                 elif pattern == "*" or filename.endswith(pattern.replace('*', '')):
@@ -145,16 +451,69 @@ class DataAdapter:
             return os.path.exists(path)
 
     def _gcs_file_exists(self, gcs_path: str) -> bool:
-        """Check if file exists in GCS bucket."""
+        """Check if file exists in GCS bucket, using the (cached) listing of its directory."""
         try:
             bucket_name, object_name = self._parse_gcs_path(gcs_path)
-            client = self._get_gcs_client()
-            bucket = client.bucket(bucket_name)
-            blob = bucket.blob(object_name)
-            return blob.exists()
+            return object_name in self._gcs_objects(bucket_name, _gcs_directory(object_name))
         except Exception:
             return False
 
+    def get_modified_time(self, path: str) -> float:
+        """
+        Get last modification time of a local file or GCS object.
+
+        GCS times come from the cached listing of the object's directory (see
+        _gcs_objects), so they may be up to GCS_LISTING_TTL seconds old for
+        objects changed outside this adapter.
+
+        Args:
+            path: Local file path or GCS bucket path (gs://bucket/path)
+
+        Returns:
+            Modification time as a POSIX timestamp
+
+        Raises:
+            FileNotFoundError: If the file or GCS object does not exist
+        """
+        if self._is_gcs_path(path):
+            return self._gcs_modified_time(path)
+        else:
+            return os.path.getmtime(path)
+
+    def _gcs_modified_time(self, gcs_path: str) -> float:
+        """Get modification time of a GCS object from its directory listing, or its metadata if unlisted."""
+        bucket_name, object_name = self._parse_gcs_path(gcs_path)
+
+        modified_time = self._gcs_objects(bucket_name, _gcs_directory(object_name)).get(object_name)
+        if modified_time is not None:
+            return modified_time
+
+        # Created since the listing was fetched, or missing
+        client = self._get_gcs_client()
+        bucket = client.bucket(bucket_name)
+        blob = bucket.get_blob(object_name)
+
+        if blob is None:
+            raise FileNotFoundError(f"GCS object not found: {gcs_path}")
+
+        return blob.updated.timestamp()
+
+    def get_file_size(self, path: str) -> int:
+        """
+        Get size in bytes of a local file or GCS object.
+
+        Raises:
+            FileNotFoundError: If the file or GCS object does not exist
+        """
+        if self._is_gcs_path(path):
+            bucket_name, object_name = self._parse_gcs_path(path)
+            blob = self._get_gcs_client().bucket(bucket_name).get_blob(object_name)
+            if blob is None:
+                raise FileNotFoundError(f"GCS object not found: {path}")
+            return blob.size
+        else:
+            return os.path.getsize(path)
+
     def get_full_path(self, base_path: str, filename: str) -> str:
         """Get full path for a file given base path and filename."""
         if self._is_gcs_path(base_path):
@@ -167,58 +526,340 @@ class DataAdapter:
             return os.path.join(base_path, filename)
 
     def write_json(self, path: str, data: dict) -> None:
-        """Write JSON data to local file or GCS bucket."""
+        """Write JSON data to local file or GCS bucket (encoded by dump_json_bytes)."""
         if self._is_gcs_path(path):
             self._write_json_to_gcs(path, data)
         else:
-            import json
             # Ensure local directory exists
             Path(path).parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(path, 'wb') as f:
+                f.write(dump_json_bytes(data))
 
     def _write_json_to_gcs(self, gcs_path: str, data: dict) -> None:
         """Write JSON data to GCS bucket."""
-        import json
+        blob = self._gcs_blob(gcs_path)
+
+        # Encode straight to bytes and upload
+        blob.upload_from_string(dump_json_bytes(data), content_type='application/json')
+
+        # Keep cached listings that cover this object up to date (iterate over a
+        # snapshot, as loaders on other threads may add listings meanwhile)
         bucket_name, object_name = self._parse_gcs_path(gcs_path)
+        modified_time = blob.updated.timestamp() if blob.updated is not None else time.time()
+        for (listed_bucket, prefix), (_, objects) in list(self._gcs_listings.items()):
+            if listed_bucket == bucket_name and object_name.startswith(prefix):
+                objects[object_name] = modified_time
 
-        client = self._get_gcs_client()
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(object_name)
+    def invalidate_listings(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached GCS prefix listings (object names and modification times) so they are fetched again.
+
+        Needed only for objects written outside this adapter; its own writes
+        update the cached listings.
 
-        # Convert to JSON string and upload
-        json_string = json.dumps(data, indent=2)
-        blob.upload_from_string(json_string, content_type='application/json')
+        Args:
+            path: GCS path whose covering listings to drop (None drops all listings)
+        """
+        if path is None:
+            self._gcs_listings.clear()
+            return
+
+        if not self._is_gcs_path(path):
+            return
+        bucket_name, object_name = self._parse_gcs_path(path)
+        for key in list(self._gcs_listings):
+            listed_bucket, prefix = key
+            if listed_bucket == bucket_name and (object_name.startswith(prefix) or prefix.startswith(object_name)):
+                self._gcs_listings.pop(key, None)
 
     def read_json(self, path: str) -> dict:
         """Read JSON data from local file or GCS bucket."""
         if self._is_gcs_path(path):
             return self._read_json_from_gcs(path)
         else:
-            import json
-            with open(path, 'r') as f:
-                return json.load(f)
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return _parse_json(b'')
+                # Parse straight from the page cache instead of copying the file into a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return _parse_json(view)
+
+    def read_json_key(self, path: str, key: str) -> Any:
+        """
+        Read a single top-level value from a JSON object file.
 
-    def _read_json_from_gcs(self, gcs_path: str) -> dict:
-        """Read JSON data from GCS bucket."""
-        import json
-        bucket_name, object_name = self._parse_gcs_path(gcs_path)
+        For local files the document is streamed with ijson when it is installed,
+        so only the requested value is built in memory; otherwise the whole file
+        is parsed.
 
-        client = self._get_gcs_client()
-        bucket = client.bucket(bucket_name)
-        blob = bucket.blob(object_name)
+        Args:
+            path: Local file path or GCS bucket path (gs://bucket/path)
+            key: Top-level key to read
 
-        if not blob.exists():
-            raise FileNotFoundError(f"GCS object not found: {gcs_path}")
+        Returns:
+            The value stored under key
 
-        # Download and parse JSON
-        json_string = blob.download_as_text()
-        return json.loads(json_string)
+        Raises:
+            KeyError: If the key is not present
+        """
+        if not self._is_gcs_path(path):
+            try:
+                import ijson
+            except ImportError:
+                pass
+            else:
+                with open(path, 'rb') as f:
+                    for value in ijson.items(f, key, use_float=True):
+                        return value
+                raise KeyError(key)
+
+        return self.read_json(path)[key]
+
+    def _read_json_from_gcs(self, gcs_path: str) -> dict:
+        """Read JSON data from GCS bucket."""
+        # Download directly; a missing object fails the download rather than a separate metadata request
+        with _gcs_not_found_as_error(gcs_path):
+            data = self._gcs_blob(gcs_path).download_as_bytes()
+        return _parse_json(data)
+
+
+def _gcs_directory(object_name: str) -> str:
+    """Get the listing prefix of a GCS object's directory ('' for top-level objects)."""
+    return object_name.rsplit('/', 1)[0] + '/' if '/' in object_name else ''
+
+
+@contextmanager
+def _gcs_not_found_as_error(gcs_path: str) -> Iterator[None]:
+    """Translate a GCS NotFound error raised inside the block into FileNotFoundError."""
+    from google.cloud.exceptions import NotFound
+    try:
+        yield
+    except NotFound:
+        raise FileNotFoundError(f"GCS object not found: {gcs_path}") from None
+
+
+def dump_json_bytes(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Values neither encoder supports natively are converted by _json_default
+    (numpy values to Python values, anything else to its string form).
+
+    Args:
+        data: JSON-serializable data
+        indent: Whether to indent the output by two spaces
+
+    Returns:
+        Encoded JSON document
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, default=_json_default, option=option)
+    except orjson.JSONEncodeError:
+        return json.dumps(data, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
+
+def _json_default(value: Any) -> Any:
+    """Convert a value the JSON encoders cannot serialize (numpy types via tolist(), others via str())."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def _write_parquet_atomically(df: pd.DataFrame, path: str, dtype: Any = None) -> None:
+    """
+    Write a DataFrame to Parquet through a uniquely named temporary file in the same directory.
+
+    Readers never see a partial file, concurrent writers of the same path do not
+    share a temporary file, and the temporary file is removed however writing ends.
+    The CSV_SCHEMAS dtype the data was parsed with is stored under PARQUET_DTYPE_KEY.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           PARQUET_DTYPE_KEY: repr(dtype).encode()})
+
+    fd, temp_path = tempfile.mkstemp(prefix='.', suffix='.parquet.tmp', dir=os.path.dirname(path) or '.')
+    os.close(fd)
+    try:
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+def _parquet_dtype_matches(path: str, dtype: Any) -> bool:
+    """Check whether a Parquet copy was written with the given CSV_SCHEMAS dtype (False if unreadable)."""
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+    except Exception:
+        return False
+    return metadata.get(PARQUET_DTYPE_KEY) == repr(dtype).encode()
+
+
+def _csv_dtype(path: str) -> Any:
+    """Get the declared dtype for a CSV file from CSV_SCHEMAS (None to infer types)."""
+    return CSV_SCHEMAS.get(os.path.basename(path), {}).get('dtype')
+
+
+def _read_csv_file(path: str, columns: Optional[List[str]] = None, dtype: Any = None) -> pd.DataFrame:
+    """
+    Parse a full local CSV file, using pyarrow's multi-threaded reader when it is installed.
+
+    Columns pyarrow infers as dates or timestamps are read again as strings, and
+    empty columns as float64, so the result matches pd.read_csv; cells in pandas'
+    default NA set are read as missing. Files pyarrow rejects (e.g. rows with a
+    varying number of fields), headers with repeated or blank names, which pandas
+    renames ('a.1', 'Unnamed: 2'), and integers outside the int64 range, which
+    pandas keeps exact (as uint64 or text), are parsed by pandas instead.
+
+    Args:
+        path: Local CSV file path
+        columns: Subset of columns to load (None for all columns)
+        dtype: str to read every column as text without type inference,
+               or None to infer types
+
+    Returns:
+        DataFrame with loaded data
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+    if dtype is not None and dtype is not str:
+        return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+    with open(path, newline='', encoding='utf-8-sig', errors='replace') as f:
+        header = next(csv.reader(f), [])
+    if len(set(header)) != len(header) or '' in header:
+        return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    convert_options = pa_csv.ConvertOptions(include_columns=columns, null_values=CSV_NULL_VALUES,
+                                            strings_can_be_null=True)
+    try:
+        if dtype is str:
+            # Declare every column from the header as a string; nothing is inferred
+            convert_options.column_types = {name: pa.string() for name in header}
+            table = pa_csv.read_csv(path, read_options=read_options, convert_options=convert_options)
+        else:
+            table = pa_csv.read_csv(path, read_options=read_options, convert_options=convert_options)
+            if _has_int64_overflow(table):
+                return pd.read_csv(path, usecols=columns, dtype=dtype)
+            # pandas leaves dates as text and reads empty columns as float64
+            retyped_columns = {field.name: pa.string() if pa.types.is_temporal(field.type) else pa.float64()
+                               for field in table.schema
+                               if pa.types.is_temporal(field.type) or pa.types.is_null(field.type)}
+            if retyped_columns:
+                convert_options.column_types = retyped_columns
+                table = pa_csv.read_csv(path, read_options=read_options, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+    return table.to_pandas(self_destruct=True)
+
+
+def _has_int64_overflow(table) -> bool:
+    """Check whether pyarrow read any column as floating point because an integer overflowed int64."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for field in table.schema:
+        if pa.types.is_floating(field.type):
+            bounds = pc.min_max(table[field.name])
+            low, high = bounds['min'].as_py(), bounds['max'].as_py()
+            if high is not None and (high >= INT64_BOUND or low <= -INT64_BOUND):
+                return True
+    return False
+
+
+def _parse_json(data: Union[bytes, memoryview]) -> dict:
+    """
+    Parse JSON bytes (or a memoryview over them), using orjson when it is installed.
+
+    Falls back to the standard library if orjson is unavailable or rejects the
+    document (e.g. NaN values, which json.dump writes by default).
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(bytes(data))
+
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(bytes(data))
 
 
 def get_data_paths():
     """Get configured data paths from centralized configuration."""
-    return config.data_paths
+    return get_config().data_paths
+
+
+# Connections kept open per host by the shared GCS client
+GCS_CONNECTION_POOL_SIZE = 32
+
+# Connection attempts retried when a pooled keep-alive connection has been closed by the server
+GCS_CONNECTION_RETRIES = 3
+
+# Shared GCS clients by project ID (created under _gcs_clients_lock, since
+# loaders may call GCS from worker threads)
+_gcs_clients_lock = threading.Lock()
+_gcs_clients = {}
+
+
+def _get_shared_gcs_client(project_id: Optional[str] = None):
+    """
+    Get or create the GCS client for a project, shared by all adapters.
+
+    A storage.Client holds an authenticated HTTP session with a connection pool,
+    so sharing one avoids repeated TLS handshakes. The pool is enlarged to
+    GCS_CONNECTION_POOL_SIZE keep-alive connections for parallel downloads, and
+    connection errors on reused connections are retried GCS_CONNECTION_RETRIES times.
+
+    Args:
+        project_id: GCS project ID for authentication
+
+    Returns:
+        google.cloud.storage.Client instance
+
+    Raises:
+        ImportError: If google-cloud-storage is not installed
+    """
+    client = _gcs_clients.get(project_id)
+    if client is not None:
+        return client
+
+    with _gcs_clients_lock:
+        client = _gcs_clients.get(project_id)
+        if client is None:
+            try:
+                from google.cloud import storage
+            except ImportError:
+                raise ImportError("google-cloud-storage not installed. Run: pip install google-cloud-storage")
+
+            client = storage.Client(project=project_id)
+
+            from requests.adapters import HTTPAdapter
+            client._http.mount('https://', HTTPAdapter(pool_connections=GCS_CONNECTION_POOL_SIZE,
+                                                       pool_maxsize=GCS_CONNECTION_POOL_SIZE,
+                                                       max_retries=GCS_CONNECTION_RETRIES))
+            _gcs_clients[project_id] = client
+    return client
 
 
 # Global data adapter instance
@@ -228,5 +869,5 @@ def get_data_adapter():
     """Get global data adapter instance."""
     global _data_adapter
     if _data_adapter is None:
-        _data_adapter = DataAdapter(config.gcs_project)
+        _data_adapter = DataAdapter(get_config().gcs_project)
     return _data_adapter
\ No newline at end of file
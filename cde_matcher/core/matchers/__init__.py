@@ -5,14 +5,14 @@ Contains the base matcher interface and implementations for various
 matching strategies including exact, fuzzy, and semantic matching.
 """
 
-from .base import BaseMatcher, MatchResult, MatcherError, ConfigurationError, MatchingError
+from .base import BaseMatcher, MatchResult, MatchResultBatch, MatcherError, ConfigurationError, MatchingError
 from .exact import ExactMatcher
 from .fuzzy import FuzzyMatcher
 from .semantic import SemanticMatcher
-from .factory import MatcherFactory, create_matcher, create_ensemble
+from .factory import MatcherFactory, create_matcher, create_ensemble, match_ensemble
 
 __all__ = [
-    "BaseMatcher", "MatchResult", "MatcherError", "ConfigurationError", "MatchingError",
+    "BaseMatcher", "MatchResult", "MatchResultBatch", "MatcherError", "ConfigurationError", "MatchingError",
     "ExactMatcher", "FuzzyMatcher", "SemanticMatcher",
-    "MatcherFactory", "create_matcher", "create_ensemble"
+    "MatcherFactory", "create_matcher", "create_ensemble", "match_ensemble"
 ]
\ No newline at end of file
@@ -5,16 +5,24 @@ This module defines the abstract base class for all matchers and the
 MatchResult dataclass for representing matching results.
 """
 
+import heapq
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from itertools import repeat
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Iterator
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class MatchResult:
     """
     Represents a single match result between a source variable and target CDE.
 
+    Instances use __slots__ (no per-instance __dict__), since matchers create one
+    per matching pair.
+
     Attributes:
         source: The original variable name being matched
         target: The CDE item that was matched against
@@ -43,6 +51,82 @@ class MatchResult:
             raise ValueError(f"Confidence must be between 0.0 and 1.0, got {self.confidence}")
 
 
+@dataclass
+class MatchResultBatch:
+    """
+    Match results of one matcher call stored as parallel arrays.
+
+    Filtering and sorting many results then run as numpy operations on
+    contiguous arrays instead of Python loops over MatchResult objects.
+    All results share one metadata dictionary.
+
+    Attributes:
+        sources: Source variable name of each result (object array)
+        targets: Matched CDE item of each result (object array)
+        confidence: Confidence score of each result between 0.0 and 1.0
+        match_type: Type of matching algorithm used for all results
+        metadata: Information shared by all results (algorithm params, etc.)
+    """
+    sources: np.ndarray
+    targets: np.ndarray
+    confidence: np.ndarray
+    match_type: str
+    metadata: Dict[str, Any]
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+    def _take(self, indices: np.ndarray) -> 'MatchResultBatch':
+        """Select results by index or boolean mask."""
+        return MatchResultBatch(
+            sources=self.sources[indices],
+            targets=self.targets[indices],
+            confidence=self.confidence[indices],
+            match_type=self.match_type,
+            metadata=self.metadata
+        )
+
+    def filter(self, min_confidence: float) -> 'MatchResultBatch':
+        """Keep only results with confidence of at least min_confidence."""
+        return self._take(self.confidence >= min_confidence)
+
+    def sorted(self, limit: Optional[int] = None) -> 'MatchResultBatch':
+        """
+        Sort results by confidence (highest first), keeping ties in their current order.
+
+        Args:
+            limit: Maximum number of results to keep (None for all)
+        """
+        order = np.argsort(-self.confidence, kind='stable')
+        return self._take(order[:limit])
+
+    def quantized_confidence(self) -> np.ndarray:
+        """
+        Get the confidence scores rounded to whole percent as uint8 (0-100).
+
+        One byte per result instead of eight, for storing or bucketing many
+        scores. Rounding is lossy (e.g. 0.857 becomes 86), so filtering and
+        sorting use the float scores.
+        """
+        return np.rint(self.confidence * 100).astype(np.uint8)
+
+    def __iter__(self) -> Iterator[MatchResult]:
+        """Yield the results as MatchResult objects (sharing the metadata dictionary)."""
+        for source, target, confidence in zip(self.sources.tolist(), self.targets.tolist(),
+                                              self.confidence.tolist()):
+            yield MatchResult(
+                source=source,
+                target=target,
+                confidence=confidence,
+                match_type=self.match_type,
+                metadata=self.metadata
+            )
+
+    def to_list(self) -> List[MatchResult]:
+        """Convert the results to a list of MatchResult objects."""
+        return list(self)
+
+
 class BaseMatcher(ABC):
     """
     Abstract base class for all matching algorithms.
@@ -65,6 +149,9 @@ class BaseMatcher(ABC):
         ...         pass
     """
 
+    # Copy of the last validated target list (see validate_inputs)
+    _current_targets: Optional[List[str]] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -118,9 +205,31 @@ class BaseMatcher(ABC):
         """
         pass
 
+    def match_batch(self, sources: List[str], targets: List[str]) -> List[List[MatchResult]]:
+        """
+        Match many source variables against the same target CDEs.
+
+        The default calls match() once per source; matchers override it with an
+        implementation that shares work across sources.
+
+        Args:
+            sources: Variable names to match
+            targets: List of CDE items to match against
+
+        Returns:
+            One list of MatchResult objects per source (in source order)
+        """
+        return list(map(self.match, sources, repeat(targets)))
+
     def validate_inputs(self, source: str, targets: List[str]) -> None:
         """
-        Validate input parameters for matching.
+        Validate input parameters for matching and track the current target list.
+
+        A copy of the last valid target list is kept, so matching many sources
+        one at a time against the same CDE list checks its items once; later
+        calls only compare the list with the copy. When it differs (a new or
+        mutated list), _targets_changed() drops all data subclasses derived
+        from the previous list, so their caches need no comparisons of their own.
 
         Args:
             source: Variable name to validate
@@ -135,20 +244,52 @@ class BaseMatcher(ABC):
         if not targets:
             raise ValueError("Targets list cannot be empty")
 
-        if not all(isinstance(target, str) and target.strip() for target in targets):
+        if targets == self._current_targets:
+            return
+
+        # str.strip rejects non-strings with TypeError; blank targets strip to ''
+        try:
+            valid = all(map(str.strip, targets))
+        except TypeError:
+            valid = False
+        if not valid:
             raise ValueError("All targets must be non-empty strings")
 
-    def sort_results(self, results: List[MatchResult]) -> List[MatchResult]:
+        self._current_targets = list(targets)
+        self._targets_changed()
+
+    def _targets_changed(self) -> None:
+        """Drop data derived from the previous target list (nothing by default)."""
+
+    def _reset_targets(self) -> None:
+        """
+        Forget the current target list after a configuration change its derived data depends on.
+
+        The next call validates its targets again and rebuilds the derived data.
+        """
+        self._current_targets = None
+
+    def sort_results(self, results: List[MatchResult], limit: Optional[int] = None) -> List[MatchResult]:
         """
         Sort match results by confidence score (highest first).
 
+        With a limit, only the top results are selected (a heap of size limit
+        instead of a full sort). Ties keep their original order either way.
+
         Args:
             results: List of MatchResult objects to sort
+            limit: Maximum number of results to return (None for all)
 
         Returns:
             Sorted list of MatchResult objects
         """
-        return sorted(results, key=lambda x: x.confidence, reverse=True)
+        if limit is not None:
+            return heapq.nlargest(limit, results, key=_confidence)
+        return sorted(results, key=_confidence, reverse=True)
+
+
+# C-level key function for sorting results
+_confidence = attrgetter('confidence')
 
 
 class MatcherError(Exception):
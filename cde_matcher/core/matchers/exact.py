@@ -5,7 +5,7 @@ This module provides exact string matching functionality using the BaseMatcher i
 Supports both case-sensitive and case-insensitive matching.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 from .base import BaseMatcher, MatchResult, ConfigurationError
 
 
@@ -27,6 +27,8 @@ class ExactMatcher(BaseMatcher):
         """Initialize the ExactMatcher with default configuration."""
         self._case_sensitive = True
         self._configured = False
+        # Index of the current target list, built when first needed (see _get_target_index)
+        self._target_index: Optional[Dict[str, Sequence[int]]] = None
 
     @property
     def name(self) -> str:
@@ -49,6 +51,7 @@ class ExactMatcher(BaseMatcher):
 
         self._case_sensitive = case_sensitive
         self._configured = True
+        self._reset_targets()
 
     def match(self, source: str, targets: List[str]) -> List[MatchResult]:
         """
@@ -71,31 +74,114 @@ class ExactMatcher(BaseMatcher):
         # Validate inputs
         self.validate_inputs(source, targets)
 
-        results = []
-
         # Prepare source for comparison
         source_compare = source if self._case_sensitive else source.lower()
 
-        for target in targets:
-            # Prepare target for comparison
-            target_compare = target if self._case_sensitive else target.lower()
+        # One dictionary lookup instead of a comparison against every target
+        match_type = self.name
+        results = [
+            MatchResult(
+                source=source,
+                target=targets[index],
+                confidence=1.0,
+                match_type=match_type,
+                metadata={
+                    "case_sensitive": self._case_sensitive,
+                    "source_normalized": source_compare,
+                    "target_normalized": source_compare
+                }
+            )
+            for index in self._get_target_index(targets).get(source_compare, [])
+        ]
+
+        return self.sort_results(results)
+
+    def match_batch(self, sources: List[str], targets: List[str]) -> List[List[MatchResult]]:
+        """
+        Find exact matches for many sources against the same targets.
+
+        Targets are indexed by their comparison form once, so each source is a
+        single dictionary lookup instead of a comparison against every target.
+        The results are the same as calling match() for each source.
+
+        Args:
+            sources: Variable names to match
+            targets: List of CDE items to match against
+
+        Returns:
+            One list of MatchResult objects per source (in source order)
+
+        Raises:
+            RuntimeError: If matcher is not configured
+            ValueError: If inputs are invalid
+        """
+        if not self._configured:
+            raise RuntimeError("Matcher must be configured before use. Call configure() first.")
 
-            # Check for exact match
-            if source_compare == target_compare:
-                result = MatchResult(
+        if not sources:
+            return []
+
+        # Validate inputs (targets once, then the remaining sources)
+        self.validate_inputs(sources[0], targets)
+        if not all(source and source.strip() for source in sources):
+            raise ValueError("Source variable name cannot be empty")
+
+        # Normalize and look up all sources with C-level map calls; most sources
+        # have no exact match, and those only cost the lookup
+        target_index = self._get_target_index(targets)
+        sources_compare = sources if self._case_sensitive else list(map(str.lower, sources))
+        hits = map(target_index.get, sources_compare)
+        match_type = self.name
+
+        batch_results = []
+        for source, source_compare, indices in zip(sources, sources_compare, hits):
+            if indices is None:
+                batch_results.append([])
+                continue
+            batch_results.append([
+                MatchResult(
                     source=source,
-                    target=target,
+                    target=targets[index],
                     confidence=1.0,
-                    match_type=self.name,
+                    match_type=match_type,
                     metadata={
                         "case_sensitive": self._case_sensitive,
                         "source_normalized": source_compare,
-                        "target_normalized": target_compare
+                        "target_normalized": source_compare
                     }
                 )
-                results.append(result)
+                for index in indices
+            ])
 
-        return self.sort_results(results)
+        return batch_results
+
+    def _get_target_index(self, targets: List[str]) -> Dict[str, Sequence[int]]:
+        """
+        Get the index mapping each target's comparison form to its positions in targets.
+
+        Lowercasing and indexing run as C-level map/zip/dict calls; a Python loop
+        is only needed to group positions when some targets share a form.
+
+        The index is kept until the target list changes, so matching many sources
+        one at a time against the same CDE list builds it once.
+        """
+        if self._target_index is None:
+            targets_compare = targets if self._case_sensitive else list(map(str.lower, targets))
+
+            # Comparison form -> (position,), built entirely in C when the forms are distinct
+            target_index: Dict[str, Sequence[int]] = dict(zip(targets_compare, zip(range(len(targets_compare)))))
+            if len(target_index) < len(targets_compare):
+                # Repeated forms: group all their positions, in target order
+                target_index = {}
+                for index, target_compare in enumerate(targets_compare):
+                    target_index.setdefault(target_compare, []).append(index)
+
+            self._target_index = target_index
+        return self._target_index
+
+    def _targets_changed(self) -> None:
+        """Drop the index of the previous target list."""
+        self._target_index = None
 
     def get_configuration(self) -> Dict[str, Any]:
         """
@@ -5,8 +5,10 @@ This module provides a factory pattern implementation for creating
 matcher instances with consistent configuration.
 """
 
+import copy
+from operator import attrgetter
 from typing import Dict, Any, Type, List
-from .base import BaseMatcher, MatcherError
+from .base import BaseMatcher, MatchResult, MatcherError
 from .exact import ExactMatcher
 from .fuzzy import FuzzyMatcher
 from .semantic import SemanticMatcher
@@ -32,6 +34,8 @@ class MatcherFactory:
             'fuzzy': FuzzyMatcher,
             'semantic': SemanticMatcher,
         }
+        # Matcher type -> info returned by get_matcher_info, built on first request
+        self._info: Dict[str, Dict[str, Any]] = {}
 
     def register_matcher(self, name: str, matcher_class: Type[BaseMatcher]) -> None:
         """
@@ -48,6 +52,7 @@ class MatcherFactory:
             raise MatcherError(f"Matcher class must inherit from BaseMatcher")
 
         self._matchers[name] = matcher_class
+        self._info.pop(name, None)
 
     def create_matcher(self, matcher_type: str, **config) -> BaseMatcher:
         """
@@ -98,6 +103,7 @@ class MatcherFactory:
             ...     {'type': 'semantic'}
             ... ]
             >>> matchers = factory.create_ensemble(configs)
+            >>> results = match_ensemble(matchers, sources, targets)
         """
         matchers = []
 
@@ -140,6 +146,14 @@ class MatcherFactory:
             available = ', '.join(self._matchers.keys())
             raise MatcherError(f"Unknown matcher type '{matcher_type}'. Available: {available}")
 
+        if matcher_type not in self._info:
+            self._info[matcher_type] = self._build_matcher_info(matcher_type)
+
+        # Copy, so callers can't modify the cached info
+        return copy.deepcopy(self._info[matcher_type])
+
+    def _build_matcher_info(self, matcher_type: str) -> Dict[str, Any]:
+        """Build the information dictionary of a registered matcher type."""
         matcher_class = self._matchers[matcher_type]
 
         # Create a temporary instance to get default configuration
@@ -190,4 +204,31 @@ def create_ensemble(matcher_configs: List[Dict[str, Any]]) -> List[BaseMatcher]:
     Returns:
         List of configured matcher instances
     """
-    return default_factory.create_ensemble(matcher_configs)
\ No newline at end of file
+    return default_factory.create_ensemble(matcher_configs)
+
+
+def match_ensemble(matchers: List[BaseMatcher], sources: List[str],
+                   targets: List[str]) -> List[List[MatchResult]]:
+    """
+    Match many sources with every matcher of an ensemble.
+
+    Each matcher runs once over all sources through match_batch, which the
+    built-in matchers implement without a Python-level match() call per source.
+
+    Args:
+        matchers: Configured matchers, e.g. from create_ensemble
+        sources: Variable names to match
+        targets: List of CDE items to match against
+
+    Returns:
+        One list of MatchResult objects per source (in source order), combining
+        the results of all matchers sorted by confidence (highest first); ties
+        keep matcher order
+    """
+    combined = [[] for _ in sources]
+    for matcher in matchers:
+        for source_results, results in zip(combined, matcher.match_batch(sources, targets)):
+            source_results.extend(results)
+
+    by_confidence = attrgetter('confidence')
+    return [sorted(source_results, key=by_confidence, reverse=True) for source_results in combined]
\ No newline at end of file
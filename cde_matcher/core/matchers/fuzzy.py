@@ -5,9 +5,27 @@ This module provides fuzzy string matching functionality with multiple algorithm
 and configurable thresholds using the BaseMatcher interface.
 """
 
-from typing import List, Dict, Any, Optional
+import math
+from typing import List, Dict, Any, Optional, Tuple, Callable
+
+import numpy as np
 from rapidfuzz import fuzz, process
-from .base import BaseMatcher, MatchResult, ConfigurationError
+from .base import BaseMatcher, MatchResult, MatchResultBatch, ConfigurationError
+
+
+def _identity(text: str) -> str:
+    """Return text unchanged (normalization for case-sensitive matching)."""
+    return text
+
+
+def _sort_tokens(text: str) -> str:
+    """Return the whitespace-separated tokens of text sorted and joined by spaces."""
+    return " ".join(sorted(text.split()))
+
+
+def _char_ngrams(text: str, n: int = 3) -> set:
+    """Return the set of character n-grams of text (the text itself if shorter than n)."""
+    return {text[i:i + n] for i in range(max(1, len(text) - n + 1))}
 
 
 class FuzzyMatcher(BaseMatcher):
@@ -35,13 +53,29 @@ class FuzzyMatcher(BaseMatcher):
         'token_set_ratio': fuzz.token_set_ratio,
     }
 
+    # Number of MinHash permutations used for LSH blocking
+    LSH_NUM_PERM = 64
+
     def __init__(self):
         """Initialize the FuzzyMatcher with default configuration."""
         self._threshold = 0.7
         self._algorithm = 'ratio'
         self._case_sensitive = False
         self._max_results = None  # No limit by default
+        self._lsh_threshold = None  # No LSH blocking by default
+        self._verbose_metadata = True
         self._configured = False
+        # Scorer and normalization resolved from the configuration once, not per call
+        self._scorer = self.ALGORITHMS[self._algorithm]
+        self._normalize = str.lower
+        # Data derived from the current target list, built when first needed and
+        # dropped when the list changes: lowercased targets (see _normalize_targets),
+        # token-sorted targets (see _coarse_inputs) and target lengths with an
+        # object array for selecting candidates (see _length_candidates)
+        self._targets_lower: Optional[List[str]] = None
+        self._targets_token_sorted: Optional[List[str]] = None
+        self._target_lengths: Optional[np.ndarray] = None
+        self._target_array: Optional[np.ndarray] = None
 
     @property
     def name(self) -> str:
@@ -53,6 +87,8 @@ class FuzzyMatcher(BaseMatcher):
                  algorithm: str = 'ratio',
                  case_sensitive: bool = False,
                  max_results: Optional[int] = None,
+                 lsh_threshold: Optional[float] = None,
+                 verbose_metadata: bool = True,
                  **kwargs) -> None:
         """
         Configure the fuzzy matcher.
@@ -63,6 +99,18 @@ class FuzzyMatcher(BaseMatcher):
                       'token_sort_ratio', 'token_set_ratio')
             case_sensitive: Whether to perform case-sensitive matching
             max_results: Maximum number of results to return (None for all)
+            lsh_threshold: Jaccard similarity of character 3-grams used to pre-select
+                          candidate targets in match_batch (None scores all pairs).
+                          Requires datasketch; pairs that are not candidates are
+                          not scored, so some matches may be missed. Only
+                          match_batch uses it: match(), match_arrays() and
+                          get_best_matches() always score every target, so
+                          match_batch can return fewer matches than match().
+            verbose_metadata: Whether each result gets its own metadata with the raw
+                             score and normalized names. If False, the results of a
+                             call share one metadata dict holding only the call's
+                             settings (treat it as read-only); the raw score is
+                             confidence * 100.
             **kwargs: Additional configuration parameters (ignored)
 
         Raises:
@@ -85,11 +133,24 @@ class FuzzyMatcher(BaseMatcher):
         if max_results is not None and (not isinstance(max_results, int) or max_results <= 0):
             raise ConfigurationError(f"max_results must be positive integer or None, got {max_results}")
 
+        # Validate lsh_threshold
+        if lsh_threshold is not None and not 0.0 < lsh_threshold < 1.0:
+            raise ConfigurationError(f"lsh_threshold must be between 0.0 and 1.0 (exclusive) or None, got {lsh_threshold}")
+
+        # Validate verbose_metadata
+        if not isinstance(verbose_metadata, bool):
+            raise ConfigurationError(f"verbose_metadata must be boolean, got {type(verbose_metadata)}")
+
         self._threshold = threshold
         self._algorithm = algorithm
         self._case_sensitive = case_sensitive
         self._max_results = max_results
+        self._lsh_threshold = lsh_threshold
+        self._verbose_metadata = verbose_metadata
+        self._scorer = self.ALGORITHMS[algorithm]
+        self._normalize = _identity if case_sensitive else str.lower
         self._configured = True
+        self._reset_targets()
 
     def match(self, source: str, targets: List[str]) -> List[MatchResult]:
         """
@@ -112,63 +173,79 @@ class FuzzyMatcher(BaseMatcher):
         # Validate inputs
         self.validate_inputs(source, targets)
 
-        results = []
+        # Prepare source and targets for comparison
+        source_compare = self._normalize(source)
+        targets_compare = self._normalize_targets(targets)
 
-        # Get the algorithm function
-        algorithm_func = self.ALGORITHMS[self._algorithm]
+        candidate_indices = self._coarse_candidates(source_compare, targets_compare)
+        return self._score_candidates(source, source_compare, targets, targets_compare, candidate_indices)
 
-        # Prepare source for comparison
-        source_compare = source if self._case_sensitive else source.lower()
+    def match_arrays(self, source: str, targets: List[str]) -> MatchResultBatch:
+        """
+        Find fuzzy matches as a MatchResultBatch of parallel arrays.
 
-        for target in targets:
-            # Prepare target for comparison
-            target_compare = target if self._case_sensitive else target.lower()
+        The same matches as match(), but the candidates are rescored in one
+        rapidfuzz.process.cdist call and filtered and sorted with numpy, without
+        creating a MatchResult per match. Results share the compact metadata.
 
-            # Calculate similarity score (rapidfuzz returns 0-100, normalize to 0-1)
-            raw_score = algorithm_func(source_compare, target_compare)
-            confidence = raw_score / 100.0
+        Args:
+            source: Variable name to match
+            targets: List of CDE items to match against
 
-            # Only include matches above threshold
-            if confidence >= self._threshold:
-                result = MatchResult(
-                    source=source,
-                    target=target,
-                    confidence=confidence,
-                    match_type=self.name,
-                    metadata={
-                        "algorithm": self._algorithm,
-                        "threshold": self._threshold,
-                        "case_sensitive": self._case_sensitive,
-                        "raw_score": raw_score,
-                        "source_normalized": source_compare,
-                        "target_normalized": target_compare
-                    }
-                )
-                results.append(result)
+        Returns:
+            MatchResultBatch sorted by confidence (highest first)
+
+        Raises:
+            RuntimeError: If matcher is not configured
+            ValueError: If inputs are invalid
+        """
+        if not self._configured:
+            raise RuntimeError("Matcher must be configured before use. Call configure() first.")
 
-        # Sort by confidence (highest first)
-        results = self.sort_results(results)
+        # Validate inputs
+        self.validate_inputs(source, targets)
 
-        # Apply max_results limit if specified
-        if self._max_results is not None:
-            results = results[:self._max_results]
+        # Prepare source and targets for comparison
+        source_compare = self._normalize(source)
+        targets_compare = self._normalize_targets(targets)
+        algorithm_func = self._scorer
 
-        return results
+        # Exact scores of the coarse candidates only
+        candidate_indices = self._coarse_candidates(source_compare, targets_compare)
+        exact_scores = process.cdist(
+            [source_compare],
+            [targets_compare[index] for index in candidate_indices.tolist()],
+            scorer=algorithm_func,
+            dtype=np.float64
+        )[0]
+
+        batch = MatchResultBatch(
+            sources=np.full(len(candidate_indices), source, dtype=object),
+            targets=np.array([targets[index] for index in candidate_indices.tolist()], dtype=object),
+            confidence=exact_scores / 100.0,
+            match_type=self.name,
+            metadata=self._shared_metadata()
+        )
+        return batch.filter(self._threshold).sorted(self._max_results)
 
-    def get_best_matches(self, source: str, targets: List[str], limit: int = 5) -> List[MatchResult]:
+    def match_batch(self, sources: List[str], targets: List[str]) -> List[List[MatchResult]]:
         """
-        Get the best fuzzy matches using rapidfuzz's optimized process.
+        Find fuzzy matches for many sources against the same targets.
 
-        This method uses rapidfuzz.process.extract for better performance
-        when finding top matches from a large list.
+        All source/target pairs are scored in a single multi-threaded
+        rapidfuzz.process.cdist call instead of one scorer call per pair;
+        only pairs that can reach the threshold are rescored individually.
+        The results are the same as calling match() for each source, unless
+        lsh_threshold is configured: then only the candidate targets found by
+        MinHash LSH are scored for each source.
 
         Args:
-            source: Variable name to match
+            sources: Variable names to match
             targets: List of CDE items to match against
-            limit: Maximum number of matches to return
 
         Returns:
-            List of top MatchResult objects
+            One list of MatchResult objects per source (in source order),
+            each sorted by confidence (highest first)
 
         Raises:
             RuntimeError: If matcher is not configured
@@ -177,51 +254,385 @@ class FuzzyMatcher(BaseMatcher):
         if not self._configured:
             raise RuntimeError("Matcher must be configured before use. Call configure() first.")
 
-        # Validate inputs
-        self.validate_inputs(source, targets)
+        if not sources:
+            return []
+
+        # Validate inputs (targets once, then the remaining sources)
+        self.validate_inputs(sources[0], targets)
+        if not all(source and source.strip() for source in sources):
+            raise ValueError("Source variable name cannot be empty")
 
         # Get the algorithm function
-        algorithm_func = self.ALGORITHMS[self._algorithm]
+        algorithm_func = self._scorer
+
+        # Prepare sources and targets for comparison
+        sources_compare = list(map(self._normalize, sources))
+        targets_compare = self._normalize_targets(targets)
+
+        # Pairs are first scored coarsely into a uint8 matrix (one byte per pair
+        # instead of eight); the integer cutoff lets rapidfuzz skip hopeless pairs
+        # and keeps every pair that can reach the threshold. Only those candidates
+        # are rescored exactly and checked against the threshold as in match().
+        score_cutoff = math.floor(self._threshold * 100)
+
+        candidates = None
+        if self._lsh_threshold is not None:
+            candidates = self._lsh_candidates(sources_compare, targets_compare)
+
+        if candidates is None:
+            # Score the full matrix
+            coarse_scorer, coarse_sources, coarse_targets = self._coarse_inputs(sources_compare, targets_compare)
+            candidate_mask = process.cdist(
+                coarse_sources,
+                coarse_targets,
+                scorer=coarse_scorer,
+                score_cutoff=score_cutoff,
+                dtype=np.uint8,
+                workers=-1
+            ) >= score_cutoff
+        else:
+            # Score only the LSH candidate targets of each source
+            candidate_mask = np.zeros((len(sources_compare), len(targets_compare)), dtype=bool)
+            for row, (source_compare, target_indices) in enumerate(zip(sources_compare, candidates)):
+                if len(target_indices):
+                    coarse_scores = process.cdist(
+                        [source_compare],
+                        [targets_compare[index] for index in target_indices],
+                        scorer=algorithm_func,
+                        score_cutoff=score_cutoff,
+                        dtype=np.uint8
+                    )[0]
+                    candidate_mask[row, target_indices[coarse_scores >= score_cutoff]] = True
+
+        return [
+            self._score_candidates(source, source_compare, targets, targets_compare, np.flatnonzero(row_mask))
+            for source, source_compare, row_mask in zip(sources, sources_compare, candidate_mask)
+        ]
+
+    def _targets_changed(self) -> None:
+        """Drop the normalized, token-sorted and length data of the previous target list."""
+        self._targets_lower = None
+        self._targets_token_sorted = None
+        self._target_lengths = None
+        self._target_array = None
+
+    def _normalize_targets(self, targets: List[str]) -> List[str]:
+        """
+        Get the comparison form of the current (validated) targets.
 
-        # Prepare source for comparison
-        source_compare = source if self._case_sensitive else source.lower()
+        Matching many sources one at a time against one CDE list would otherwise
+        lowercase every target on each call, so the lowercased list is kept until
+        the target list changes.
+        """
+        if self._case_sensitive:
+            return targets
 
-        # Prepare targets for comparison
-        targets_compare = [target if self._case_sensitive else target.lower()
-                          for target in targets]
+        if self._targets_lower is None:
+            self._targets_lower = list(map(str.lower, targets))
+        return self._targets_lower
 
-        # Use rapidfuzz process.extract for optimized top-k search
-        matches = process.extract(
-            source_compare,
-            targets_compare,
-            scorer=algorithm_func,
-            limit=limit,
-            score_cutoff=self._threshold * 100  # Convert back to 0-100 scale
-        )
+    def _coarse_candidates(self, source_compare: str, targets_compare: List[str]) -> np.ndarray:
+        """
+        Find the targets that may reach the threshold for one source.
+
+        Targets whose length rules out a match are skipped (see _length_candidates);
+        the rest are scored in one coarse rapidfuzz call (see match_batch for the
+        coarse cutoff).
+
+        Args:
+            source_compare: Normalized source name
+            targets_compare: Normalized target names
+
+        Returns:
+            Sorted indices of the candidate targets
+        """
+        score_cutoff = math.floor(self._threshold * 100)
+        coarse_scorer, coarse_sources, coarse_targets = self._coarse_inputs([source_compare], targets_compare)
+        length_indices = None
+        length_candidates = self._length_candidates(coarse_scorer, coarse_sources[0], coarse_targets, score_cutoff)
+        if length_candidates is not None:
+            length_indices, coarse_targets = length_candidates
+
+        coarse_scores = process.cdist(
+            coarse_sources,
+            coarse_targets,
+            scorer=coarse_scorer,
+            score_cutoff=score_cutoff,
+            dtype=np.uint8
+        )[0]
+
+        candidate_indices = np.flatnonzero(coarse_scores >= score_cutoff)
+        if length_indices is not None:
+            candidate_indices = length_indices[candidate_indices]
+        return candidate_indices
+
+    def _coarse_inputs(self, sources_compare: List[str],
+                       targets_compare: List[str]) -> Tuple[Callable, List[str], List[str]]:
+        """
+        Get the scorer and strings for a cdist pass over normalized sources and targets.
+
+        token_sort_ratio is ratio over token-sorted strings, and cdist would split
+        and sort every target again for each source. Targets are token-sorted once
+        per target list instead (kept like the normalized targets) and scored
+        with ratio, which gives the same scores. Other algorithms are returned
+        unchanged.
+
+        Args:
+            sources_compare: Normalized source names
+            targets_compare: Normalized target names
+
+        Returns:
+            Tuple of (scorer, sources, targets) to pass to process.cdist
+        """
+        if self._algorithm != 'token_sort_ratio':
+            return self._scorer, sources_compare, targets_compare
+
+        if self._targets_token_sorted is None:
+            self._targets_token_sorted = list(map(_sort_tokens, targets_compare))
+        return fuzz.ratio, list(map(_sort_tokens, sources_compare)), self._targets_token_sorted
+
+    def _length_candidates(self, scorer: Callable, source_compare: str, targets_compare: List[str],
+                           score_cutoff: int) -> Optional[Tuple[np.ndarray, List[str]]]:
+        """
+        Find the targets whose length still allows a ratio score of score_cutoff.
+
+        fuzz.ratio is at most 200 * min(len_s, len_t) / (len_s + len_t), so at high
+        thresholds most targets can be rejected by one vectorized comparison of
+        lengths before any string is scored. This covers token_sort_ratio too,
+        whose coarse pass is ratio over token-sorted strings (see _coarse_inputs).
+        Lengths are kept per target list like the normalized targets.
+
+        Args:
+            scorer: Scorer of the coarse pass
+            source_compare: Source string as passed to the coarse pass
+            targets_compare: Target strings as passed to the coarse pass
+            score_cutoff: Integer score (0-100) a target must be able to reach
+
+        Returns:
+            Tuple of (sorted indices of the remaining targets, those targets), or
+            None if the scorer has no length bound
+        """
+        if scorer is not fuzz.ratio:
+            return None
+
+        if self._target_lengths is None:
+            self._target_lengths = np.fromiter(map(len, targets_compare), dtype=np.intp,
+                                               count=len(targets_compare))
+            self._target_array = np.array(targets_compare, dtype=object)
+
+        source_length = len(source_compare)
+        lengths = self._target_lengths
+        indices = np.flatnonzero(200 * np.minimum(lengths, source_length)
+                                 >= score_cutoff * (lengths + source_length))
+        return indices, self._target_array[indices].tolist()
+
+    def _shared_metadata(self) -> Dict[str, Any]:
+        """Get the metadata entries common to all results of one call."""
+        return {
+            "algorithm": self._algorithm,
+            "threshold": self._threshold,
+            "case_sensitive": self._case_sensitive
+        }
+
+    def _score_candidates(self, source: str, source_compare: str, targets: List[str],
+                          targets_compare: List[str], candidate_indices: np.ndarray) -> List[MatchResult]:
+        """
+        Score candidate targets exactly and build the results for one source.
+
+        Args:
+            source: Variable name being matched
+            source_compare: Normalized source name
+            targets: CDE items
+            targets_compare: Normalized CDE items
+            candidate_indices: Indices of the targets that may reach the threshold
+
+        Returns:
+            MatchResult objects above the threshold, sorted by confidence
+            (highest first) and limited to max_results
+        """
+        algorithm_func = self._scorer
+        shared_metadata = self._shared_metadata()
+        # Lets rapidfuzz stop early on hopeless pairs (they score 0); the integer
+        # floor never drops a pair that passes the threshold check below
+        score_cutoff = math.floor(self._threshold * 100)
+        match_type = self.name
 
         results = []
-        for match_text, raw_score, index in matches:
+        for index in candidate_indices:
+            # Calculate similarity score (rapidfuzz returns 0-100, normalize to 0-1)
+            raw_score = algorithm_func(source_compare, targets_compare[index], score_cutoff=score_cutoff)
             confidence = raw_score / 100.0
-            original_target = targets[index]
 
-            result = MatchResult(
-                source=source,
-                target=original_target,
-                confidence=confidence,
-                match_type=self.name,
-                metadata={
-                    "algorithm": self._algorithm,
-                    "threshold": self._threshold,
-                    "case_sensitive": self._case_sensitive,
+            # Only include matches above threshold
+            if confidence < self._threshold:
+                continue
+
+            if self._verbose_metadata:
+                metadata = {
+                    **shared_metadata,
                     "raw_score": raw_score,
                     "source_normalized": source_compare,
-                    "target_normalized": match_text,
-                    "method": "process_extract"
+                    "target_normalized": targets_compare[index]
                 }
+            else:
+                metadata = shared_metadata
+
+            result = MatchResult(
+                source=source,
+                target=targets[index],
+                confidence=confidence,
+                match_type=match_type,
+                metadata=metadata
             )
             results.append(result)
 
-        return results
+        # Sort by confidence (highest first), keeping only the top max_results if set
+        return self.sort_results(results, self._max_results)
+
+    def _lsh_candidates(self, sources_compare: List[str], targets_compare: List[str]) -> Optional[List[np.ndarray]]:
+        """
+        Find candidate targets for each source with MinHash LSH over character 3-grams.
+
+        Args:
+            sources_compare: Normalized source names
+            targets_compare: Normalized target names
+
+        Returns:
+            Sorted target indices per source, or None if datasketch is not installed
+        """
+        try:
+            from datasketch import MinHash, MinHashLSH
+        except ImportError:
+            return None
+
+        def minhash(text: str) -> MinHash:
+            signature = MinHash(num_perm=self.LSH_NUM_PERM)
+            signature.update_batch([gram.encode('utf-8') for gram in _char_ngrams(text)])
+            return signature
+
+        lsh = MinHashLSH(threshold=self._lsh_threshold, num_perm=self.LSH_NUM_PERM)
+        for index, target_compare in enumerate(targets_compare):
+            lsh.insert(index, minhash(target_compare))
+
+        return [
+            np.array(sorted(lsh.query(minhash(source_compare))), dtype=np.intp)
+            for source_compare in sources_compare
+        ]
+
+    def get_best_matches(self, source: str, targets: List[str], limit: int = 5) -> List[MatchResult]:
+        """
+        Get the best fuzzy matches of one source.
+
+        Args:
+            source: Variable name to match
+            targets: List of CDE items to match against
+            limit: Maximum number of matches to return
+
+        Returns:
+            List of top MatchResult objects
+
+        Raises:
+            RuntimeError: If matcher is not configured
+            ValueError: If inputs are invalid
+        """
+        return self.get_best_matches_batch([source], targets, limit)[0]
+
+    def get_best_matches_batch(self, sources: List[str], targets: List[str],
+                               limit: int = 5) -> List[List[MatchResult]]:
+        """
+        Get the best fuzzy matches of many sources against the same targets.
+
+        All pairs are scored in one multi-threaded rapidfuzz.process.cdist call
+        (coarsely, as in match_batch) and the top targets of each row are picked
+        with np.partition; only those are rescored exactly. Ties are ordered by
+        target position.
+
+        Args:
+            sources: Variable names to match
+            targets: List of CDE items to match against
+            limit: Maximum number of matches to return per source
+
+        Returns:
+            One list of top MatchResult objects per source (in source order)
+
+        Raises:
+            RuntimeError: If matcher is not configured
+            ValueError: If inputs are invalid
+        """
+        if not self._configured:
+            raise RuntimeError("Matcher must be configured before use. Call configure() first.")
+
+        if not sources:
+            return []
+
+        # Validate inputs (targets once, then the remaining sources)
+        self.validate_inputs(sources[0], targets)
+        if not all(source and source.strip() for source in sources):
+            raise ValueError("Source variable name cannot be empty")
+
+        # Get the algorithm function
+        algorithm_func = self._scorer
+
+        # Prepare sources and targets for comparison
+        sources_compare = list(map(self._normalize, sources))
+        targets_compare = self._normalize_targets(targets)
+
+        exact_cutoff = self._threshold * 100
+        score_cutoff = math.floor(exact_cutoff)
+        coarse_scorer, coarse_sources, coarse_targets = self._coarse_inputs(sources_compare, targets_compare)
+        coarse_scores = process.cdist(
+            coarse_sources,
+            coarse_targets,
+            scorer=coarse_scorer,
+            score_cutoff=score_cutoff,
+            dtype=np.uint8,
+            workers=-1
+        )
+
+        shared_metadata = self._shared_metadata()
+        shared_metadata["method"] = "process_cdist"
+        match_type = self.name
+
+        batch_results = []
+        for source, source_compare, row in zip(sources, sources_compare, coarse_scores):
+            candidate_indices = np.flatnonzero(row >= score_cutoff)
+            if len(candidate_indices) > limit > 0:
+                # Coarse scores order targets like exact ones (up to ties), so
+                # everything scoring at least the limit-th best coarse score is kept
+                candidate_scores = row[candidate_indices]
+                kth_score = np.partition(candidate_scores, -limit)[-limit]
+                candidate_indices = candidate_indices[candidate_scores >= kth_score]
+
+            scored = []
+            for index in candidate_indices.tolist():
+                raw_score = algorithm_func(source_compare, targets_compare[index], score_cutoff=exact_cutoff)
+                if raw_score >= exact_cutoff:
+                    scored.append((-raw_score, index))
+            scored.sort()
+
+            results = []
+            for negative_score, index in scored[:limit]:
+                raw_score = -negative_score
+                if self._verbose_metadata:
+                    metadata = {
+                        **shared_metadata,
+                        "raw_score": raw_score,
+                        "source_normalized": source_compare,
+                        "target_normalized": targets_compare[index]
+                    }
+                else:
+                    metadata = shared_metadata
+
+                results.append(MatchResult(
+                    source=source,
+                    target=targets[index],
+                    confidence=raw_score / 100.0,
+                    match_type=match_type,
+                    metadata=metadata
+                ))
+            batch_results.append(results)
+
+        return batch_results
 
     def get_configuration(self) -> Dict[str, Any]:
         """
@@ -235,6 +646,8 @@ class FuzzyMatcher(BaseMatcher):
             "algorithm": self._algorithm,
             "case_sensitive": self._case_sensitive,
             "max_results": self._max_results,
+            "lsh_threshold": self._lsh_threshold,
+            "verbose_metadata": self._verbose_metadata,
             "configured": self._configured,
             "available_algorithms": list(self.ALGORITHMS.keys())
         }
\ No newline at end of file
@@ -5,10 +5,65 @@ This module provides semantic matching functionality using predefined
 mappings between concepts and their variations in biomedical contexts.
 """
 
-from typing import List, Dict, Any, Set, Optional
+import re
+import sys
+from bisect import bisect_right
+from typing import List, Dict, Any, Set, Optional, Tuple
 from .base import BaseMatcher, MatchResult, ConfigurationError
 
 
+# Default biomedical semantic mappings: concept -> variations (deduplicated,
+# in order). Built once and shared by all matchers.
+_DEFAULT_MAPPINGS: Dict[str, Tuple[str, ...]] = {
+    concept: tuple(dict.fromkeys(variations))
+    for concept, variations in {
+        # ID-related mappings
+        'donor_id': ['participant_id', 'BB_id', 'additional_ID', 'donor_id', 'subject_id', 'patient_id'],
+
+        # Age-related mappings
+        'age_at_death': ['age_at_death', 'age_at_onset', 'age_at_diagnosis', 'death_age'],
+        'age_of_onset_cognitive_symptoms': ['age_at_onset', 'age_of_onset', 'onset_age'],
+        'age_of_dementia_diagnosis': ['age_at_diagnosis', 'diagnosis_age'],
+
+        # Demographics mappings
+        'sex': ['sex', 'gender'],
+        'race': ['race', 'ethnicity_race'],
+        'hispanic_latino': ['ethnicity', 'hispanic', 'latino'],
+        'years_of_education': ['education_years', 'education', 'years_education'],
+
+        # Genetics mappings
+        'apoe_genotype': ['apoe_genotype', 'genetics_screening', 'apoe', 'apolipoprotein'],
+
+        # Brain/tissue mappings
+        'fresh_brain_weight': ['brain_weight', 'fresh_weight'],
+        'brain_ph': ['brain_ph', 'ph', 'tissue_ph'],
+        'pmi': ['pmi', 'postmortem_interval', 'post_mortem_interval'],
+        'rin': ['rin', 'rna_integrity', 'rna_integrity_number'],
+
+        # Pathology mappings
+        'braak': ['braak_stage', 'braak_score', 'braak'],
+        'thal': ['thal_phase', 'thal_score', 'thal'],
+        'cerad_score': ['cerad', 'cerad_score'],
+
+        # Clinical assessment mappings
+        'cognitive_status': ['cognitive_status', 'dementia_status', 'cognitive_state'],
+        'last_casi_score': ['casi_score', 'casi'],
+        'last_mmse_score': ['mmse_score', 'mmse'],
+        'last_moca_score': ['moca_score', 'moca'],
+
+        # Study/diagnosis mappings
+        'primary_study_name': ['study_name', 'cohort_name', 'primary_study'],
+        'secondary_study_name': ['secondary_study', 'additional_study'],
+
+        # Additional biomedical concepts
+        'cerebrospinal_fluid': ['csf', 'cerebrospinal_fluid', 'spinal_fluid'],
+        'body_mass_index': ['bmi', 'body_mass_index'],
+        'blood_pressure': ['bp', 'blood_pressure', 'systolic', 'diastolic'],
+        'medication': ['meds', 'medication', 'drugs', 'pharmaceuticals'],
+    }.items()
+}
+
+
 class SemanticMatcher(BaseMatcher):
     """
     Semantic matcher using predefined domain knowledge mappings.
@@ -30,6 +85,26 @@ class SemanticMatcher(BaseMatcher):
         self._case_sensitive = False
         self._exact_only = False
         self._custom_mappings = {}
+        self._concept_cache = {}
+        # Concept -> [(variation, comparison form, its word set)], rebuilt with the mappings
+        self._variations_compare = {}
+        # Normalized targets and concept matches of the current target list
+        # (see _get_concept_index)
+        self._targets_compare: Optional[List[str]] = None
+        self._concept_index = {}
+        # Normalized target -> its word set, built when a partial match needs it
+        self._target_words: Dict[str, frozenset] = {}
+        # Normalized target -> its positions, and all targets joined with the
+        # start offset of each (see _match_concept)
+        self._target_positions: Optional[Dict[str, List[int]]] = None
+        self._targets_joined: Optional[str] = None
+        self._target_starts: List[int] = []
+        # Prefilter for partial concept lookups (see _update_mappings)
+        self._variations_joined = ''
+        self._variation_pattern = re.compile('')
+        # Inverted indexes for exact_only matching (see _update_mappings)
+        self._variation_concepts = {}
+        self._exact_variations = {}
         self._configured = False
 
     @property
@@ -76,6 +151,10 @@ class SemanticMatcher(BaseMatcher):
         """
         Find semantic matches between source and targets.
 
+        Concept matches over the targets are kept between calls (see
+        match_batch), so matching many sources one at a time against the same
+        CDE list checks each concept against the targets once.
+
         Args:
             source: Variable name to match
             targets: List of CDE items to match against
@@ -87,205 +166,324 @@ class SemanticMatcher(BaseMatcher):
             RuntimeError: If matcher is not configured
             ValueError: If inputs are invalid
         """
-        if not self._configured:
-            raise RuntimeError("Matcher must be configured before use. Call configure() first.")
-
-        # Validate inputs
-        self.validate_inputs(source, targets)
-
-        results = []
+        return self.match_batch([source], targets)[0]
 
-        # Prepare source for comparison
-        source_compare = source if self._case_sensitive else source.lower().strip()
+    def match_batch(self, sources: List[str], targets: List[str]) -> List[List[MatchResult]]:
+        """
+        Find semantic matches for many sources against the same targets.
 
-        # Find semantic mappings for the source
-        semantic_concepts = self._find_concepts_for_term(source_compare)
+        Whether a target matches a concept does not depend on the source, so
+        targets are normalized once and each concept is checked against all
+        targets at most once; sources mapping to the same concepts then only
+        look up the indexed matches. The index is kept for the last target
+        list until the mappings or configuration change.
 
-        if not semantic_concepts:
-            return results
+        Args:
+            sources: Variable names to match
+            targets: List of CDE items to match against
 
-        for target in targets:
-            # Prepare target for comparison
-            target_compare = target if self._case_sensitive else target.lower().strip()
+        Returns:
+            One list of MatchResult objects per source (in source order),
+            each sorted by confidence (highest first)
 
-            # Check if target matches any of the semantic concepts
-            match_info = self._check_semantic_match(source_compare, target_compare, semantic_concepts)
+        Raises:
+            RuntimeError: If matcher is not configured
+            ValueError: If inputs are invalid
+        """
+        if not self._configured:
+            raise RuntimeError("Matcher must be configured before use. Call configure() first.")
 
-            if match_info:
-                result = MatchResult(
+        if not sources:
+            return []
+
+        # Validate inputs (targets once, then the remaining sources)
+        self.validate_inputs(sources[0], targets)
+        if not all(source and source.strip() for source in sources):
+            raise ValueError("Source variable name cannot be empty")
+
+        targets_compare, concept_index = self._get_concept_index(targets)
+        match_type = self.name
+
+        # Concepts -> merged (target index, match info) pairs, shared by all
+        # sources of this call that map to the same concepts
+        merged_matches = {}
+
+        batch_results = []
+        for source in sources:
+            source_compare = source if self._case_sensitive else source.lower().strip()
+            semantic_concepts = self._find_concepts_for_term(source_compare)
+
+            concepts_key = tuple(semantic_concepts)
+            target_matches = merged_matches.get(concepts_key)
+            if target_matches is None:
+                # The first concept (in order) that matches a target wins
+                merged = {}
+                for concept in semantic_concepts:
+                    if concept not in concept_index:
+                        concept_index[concept] = self._match_concept(concept, targets_compare)
+                    for index, match_info in concept_index[concept].items():
+                        merged.setdefault(index, match_info)
+                target_matches = merged_matches[concepts_key] = sorted(merged.items())
+
+            results = [
+                MatchResult(
                     source=source,
-                    target=target,
+                    target=targets[index],
                     confidence=match_info['confidence'],
-                    match_type=self.name,
+                    match_type=match_type,
                     metadata={
                         "concept": match_info['concept'],
                         "match_method": match_info['method'],
                         "case_sensitive": self._case_sensitive,
                         "exact_only": self._exact_only,
                         "source_normalized": source_compare,
-                        "target_normalized": target_compare
+                        "target_normalized": targets_compare[index]
                     }
                 )
-                results.append(result)
+                for index, match_info in target_matches
+            ]
+            batch_results.append(self.sort_results(results))
 
-        return self.sort_results(results)
+        return batch_results
 
-    def _find_concepts_for_term(self, term: str) -> List[str]:
+    def _get_concept_index(self, targets: List[str]) -> Tuple[List[str], Dict[str, Dict[int, Dict[str, Any]]]]:
         """
-        Find semantic concepts that the given term could represent.
+        Get the normalized targets and the concept match index for a target list.
+
+        The index maps each concept to {target index: match info} and is filled
+        as concepts are first needed. Both are kept until the target list or
+        the mappings change.
+
+        Returns:
+            Tuple of (normalized targets, concept index)
+        """
+        if self._targets_compare is None:
+            self._targets_compare = [target if self._case_sensitive else target.lower().strip()
+                                     for target in targets]
+        return self._targets_compare, self._concept_index
+
+    def _targets_changed(self) -> None:
+        """Drop the normalized targets, concept index and lookup structures of the previous target list."""
+        self._targets_compare = None
+        self._concept_index = {}
+        self._target_words = {}
+        self._target_positions = None
+        self._targets_joined = None
+
+    def _match_concept(self, concept: str, targets_compare: List[str]) -> Dict[int, Dict[str, Any]]:
+        """
+        Find the targets matching one concept.
+
+        With exact_only, the concept's variations are looked up in an index of
+        the targets' positions, so the cost depends on the number of variations
+        rather than the number of targets. Partial matches are found the same
+        way per variation (see _partial_matches).
 
         Args:
-            term: The term to find concepts for
+            concept: Concept key
+            targets_compare: Normalized targets of the indexed target list
 
         Returns:
-            List of concept keys that this term might represent
+            Dictionary mapping target index to match info, in target order
         """
-        concepts = []
+        if self._target_positions is None:
+            self._target_positions = {}
+            for index, target_compare in enumerate(targets_compare):
+                self._target_positions.setdefault(target_compare, []).append(index)
+
+        if not self._exact_only:
+            return self._partial_matches(concept, targets_compare)
+
+        concept_matches = {}
+        for var_compare, variation in self._exact_variations.get(concept, {}).items():
+            for index in self._target_positions.get(var_compare, ()):
+                concept_matches[index] = {
+                    'concept': concept,
+                    'method': 'exact_semantic',
+                    'confidence': 1.0,
+                    'matched_variation': variation
+                }
+        return dict(sorted(concept_matches.items()))
+
+    def _partial_matches(self, concept: str, targets_compare: List[str]) -> Dict[int, Dict[str, Any]]:
+        """
+        Find the targets partially matching a concept, with their match info.
 
-        for concept_key, variations in self._mappings.items():
-            term_variations = [term] if self._case_sensitive else [term.lower()]
+        A target matches through the first variation (in order) that it equals,
+        contains or is contained in. Both kinds of hits are found per variation
+        without visiting other targets: occurrences of the variation in all
+        targets joined into one string, and targets equal to a substring of the
+        variation. Variations are visited in order, so the first hit of each
+        target is its matching variation.
 
-            for variation in variations:
-                var_compare = variation if self._case_sensitive else variation.lower()
-
-                if self._exact_only:
-                    # Exact match only
-                    if term in term_variations and var_compare in term_variations:
-                        concepts.append(concept_key)
-                        break
-                else:
-                    # Allow partial matches
-                    if (term in var_compare or var_compare in term or
-                        any(tv in var_compare for tv in term_variations)):
-                        concepts.append(concept_key)
-                        break
+        Args:
+            concept: Concept key
+            targets_compare: Normalized targets of the indexed target list
 
-        return concepts
+        Returns:
+            Dictionary mapping target index to match info, in target order
+        """
+        if self._targets_joined is None:
+            self._targets_joined = '\x00'.join(targets_compare)
+            self._target_starts = []
+            offset = 0
+            for target_compare in targets_compare:
+                self._target_starts.append(offset)
+                offset += len(target_compare) + 1
+
+        joined, starts = self._targets_joined, self._target_starts
+        hits = {}
+        for variation_entry in self._variations_compare.get(concept, ()):
+            var_compare = variation_entry[1]
+            if not var_compare:
+                # An empty variation is contained in every target
+                for index in range(len(targets_compare)):
+                    hits.setdefault(index, variation_entry)
+                continue
+
+            # Targets containing the variation (an occurrence spanning a separator
+            # inside a target is rejected by the containment check)
+            position = joined.find(var_compare)
+            while position >= 0:
+                index = bisect_right(starts, position) - 1
+                if index not in hits and var_compare in targets_compare[index]:
+                    hits[index] = variation_entry
+                position = joined.find(var_compare, position + 1)
+
+            # Targets contained in (or equal to) the variation
+            length = len(var_compare)
+            for start in range(length):
+                for end in range(start + 1, length + 1):
+                    for index in self._target_positions.get(var_compare[start:end], ()):
+                        hits.setdefault(index, variation_entry)
+
+        concept_matches = {}
+        for index in sorted(hits):
+            variation, var_compare, var_words = hits[index]
+            target = targets_compare[index]
+            if target == var_compare:
+                concept_matches[index] = {
+                    'concept': concept,
+                    'method': 'exact_semantic',
+                    'confidence': 1.0,
+                    'matched_variation': variation
+                }
+                continue
+
+            # Calculate confidence based on overlap (the target's words are
+            # split once and reused for every concept it matches)
+            target_words = self._target_words.get(target)
+            if target_words is None:
+                target_words = self._target_words[target] = frozenset(target.split())
+            overlap = len(target_words & var_words)
+            total_words = len(target_words | var_words)
+            confidence = 0.7 + (0.3 * overlap / total_words) if total_words > 0 else 0.7
+
+            concept_matches[index] = {
+                'concept': concept,
+                'method': 'partial_semantic',
+                'confidence': confidence,
+                'matched_variation': variation
+            }
+        return concept_matches
 
-    def _check_semantic_match(self, source: str, target: str, concepts: List[str]) -> Optional[Dict[str, Any]]:
+    def _find_concepts_for_term(self, term: str) -> List[str]:
         """
-        Check if target matches any of the source's semantic concepts.
+        Find semantic concepts that the given term could represent.
+
+        Results are memoized per term until the mappings or configuration change,
+        so repeated source terms across batches skip the scan over all mappings.
 
         Args:
-            source: Source term (normalized)
-            target: Target term (normalized)
-            concepts: List of concepts the source represents
+            term: The term to find concepts for (normalized)
 
         Returns:
-            Match information dict if match found, None otherwise
+            List of concept keys that this term might represent
         """
-        for concept in concepts:
-            if concept not in self._mappings:
-                continue
+        cached = self._concept_cache.get(term)
+        if cached is not None:
+            return cached
 
-            variations = self._mappings[concept]
+        if self._exact_only:
+            # Exact match only: one lookup in the variation -> concepts index
+            concepts = list(self._variation_concepts.get(term, ()))
+            self._concept_cache[term] = concepts
+            return concepts
 
-            for variation in variations:
-                var_compare = variation if self._case_sensitive else variation.lower()
-
-                if self._exact_only:
-                    # Exact semantic match
-                    if target == var_compare:
-                        return {
-                            'concept': concept,
-                            'method': 'exact_semantic',
-                            'confidence': 1.0,
-                            'matched_variation': variation
-                        }
-                else:
-                    # Partial semantic match
-                    if target == var_compare:
-                        return {
-                            'concept': concept,
-                            'method': 'exact_semantic',
-                            'confidence': 1.0,
-                            'matched_variation': variation
-                        }
-                    elif target in var_compare or var_compare in target:
-                        # Calculate confidence based on overlap
-                        overlap = len(set(target.split()) & set(var_compare.split()))
-                        total_words = len(set(target.split()) | set(var_compare.split()))
-                        confidence = 0.7 + (0.3 * overlap / total_words) if total_words > 0 else 0.7
-
-                        return {
-                            'concept': concept,
-                            'method': 'partial_semantic',
-                            'confidence': confidence,
-                            'matched_variation': variation
-                        }
-
-        return None
+        concepts = []
+
+        # Most terms contain no variation and occur in none: two C-level scans
+        # over all variations rule that out before the per-concept loop
+        if term not in self._variations_joined and not self._variation_pattern.search(term):
+            self._concept_cache[term] = concepts
+            return concepts
+
+        # Terms that get here hit at least one variation, and a per-concept regex
+        # alternation is slower than these short substring tests (re backtracks
+        # through each alternative rather than scanning once)
+        for concept_key, variations in self._variations_compare.items():
+            for variation, var_compare, var_words in variations:
+                # Allow partial matches
+                if term in var_compare or var_compare in term:
+                    concepts.append(concept_key)
+                    break
+
+        self._concept_cache[term] = concepts
+        return concepts
 
     def _update_mappings(self):
         """Update mappings by merging custom mappings with defaults."""
         # Start with default mappings
-        updated_mappings = self._get_default_mappings().copy()
+        updated_mappings = dict(self._get_default_mappings())
 
-        # Add custom mappings
+        # Add custom mappings (existing variations first, duplicates dropped)
         for concept, variations in self._custom_mappings.items():
-            if concept in updated_mappings:
-                # Merge with existing concept
-                existing_variations = set(updated_mappings[concept])
-                new_variations = set(variations)
-                updated_mappings[concept] = list(existing_variations | new_variations)
-            else:
-                # Add new concept
-                updated_mappings[concept] = variations
+            existing_variations = updated_mappings.get(concept, ())
+            updated_mappings[concept] = tuple(dict.fromkeys((*existing_variations, *variations)))
 
         self._mappings = updated_mappings
-
-    def _get_default_mappings(self) -> Dict[str, List[str]]:
+        self._concept_cache = {}
+        self._reset_targets()
+
+        # Lowercase and split every variation once here rather than on each comparison.
+        # Comparison forms are interned, so all matchers share one copy of each
+        # instead of every instance (and every mapping update) lowercasing its own.
+        self._variations_compare = {}
+        for concept, variations in updated_mappings.items():
+            compare_forms = []
+            for variation in variations:
+                var_compare = sys.intern(str(variation) if self._case_sensitive else variation.lower())
+                compare_forms.append((variation, var_compare, frozenset(var_compare.split())))
+            self._variations_compare[concept] = compare_forms
+
+        # Partial-match prefilter: all comparison forms joined by a separator that
+        # does not occur in names (term in any variation), and an alternation of
+        # them (any variation in term)
+        compare_forms = sorted({var_compare for forms in self._variations_compare.values()
+                                for variation, var_compare, var_words in forms}, key=len, reverse=True)
+        self._variations_joined = '\x00'.join(compare_forms)
+        self._variation_pattern = re.compile('|'.join(map(re.escape, compare_forms)))
+
+        # exact_only indexes: comparison form -> concepts (in mapping order), and
+        # per concept, comparison form -> its first variation
+        self._variation_concepts = {}
+        self._exact_variations = {}
+        for concept, compare_forms in self._variations_compare.items():
+            exact_variations = {}
+            for variation, var_compare, var_words in compare_forms:
+                exact_variations.setdefault(var_compare, variation)
+            self._exact_variations[concept] = exact_variations
+            for var_compare in exact_variations:
+                self._variation_concepts.setdefault(var_compare, []).append(concept)
+
+    def _get_default_mappings(self) -> Dict[str, Tuple[str, ...]]:
         """
         Get default biomedical semantic mappings.
 
         Returns:
-            Dictionary mapping concepts to their variations
+            Dictionary mapping concepts to their variations (shared, not copied)
         """
-        return {
-            # ID-related mappings
-            'donor_id': ['participant_id', 'BB_id', 'additional_ID', 'donor_id', 'subject_id', 'patient_id'],
-
-            # Age-related mappings
-            'age_at_death': ['age_at_death', 'age_at_onset', 'age_at_diagnosis', 'death_age'],
-            'age_of_onset_cognitive_symptoms': ['age_at_onset', 'age_of_onset', 'onset_age'],
-            'age_of_dementia_diagnosis': ['age_at_diagnosis', 'diagnosis_age'],
-
-            # Demographics mappings
-            'sex': ['sex', 'gender'],
-            'race': ['race', 'ethnicity_race'],
-            'hispanic_latino': ['ethnicity', 'hispanic', 'latino'],
-            'years_of_education': ['education_years', 'education', 'years_education'],
-
-            # Genetics mappings
-            'apoe_genotype': ['apoe_genotype', 'genetics_screening', 'apoe', 'apolipoprotein'],
-
-            # Brain/tissue mappings
-            'fresh_brain_weight': ['brain_weight', 'fresh_weight'],
-            'brain_ph': ['brain_ph', 'ph', 'tissue_ph'],
-            'pmi': ['pmi', 'postmortem_interval', 'post_mortem_interval'],
-            'rin': ['rin', 'rna_integrity', 'rna_integrity_number'],
-
-            # Pathology mappings
-            'braak': ['braak_stage', 'braak_score', 'braak'],
-            'thal': ['thal_phase', 'thal_score', 'thal'],
-            'cerad_score': ['cerad', 'cerad_score'],
-
-            # Clinical assessment mappings
-            'cognitive_status': ['cognitive_status', 'dementia_status', 'cognitive_state'],
-            'last_casi_score': ['casi_score', 'casi'],
-            'last_mmse_score': ['mmse_score', 'mmse'],
-            'last_moca_score': ['moca_score', 'moca'],
-
-            # Study/diagnosis mappings
-            'primary_study_name': ['study_name', 'cohort_name', 'primary_study'],
-            'secondary_study_name': ['secondary_study', 'additional_study'],
-
-            # Additional biomedical concepts
-            'cerebrospinal_fluid': ['csf', 'cerebrospinal_fluid', 'spinal_fluid'],
-            'body_mass_index': ['bmi', 'body_mass_index'],
-            'blood_pressure': ['bp', 'blood_pressure', 'systolic', 'diastolic'],
-            'medication': ['meds', 'medication', 'drugs', 'pharmaceuticals'],
-        }
+        return _DEFAULT_MAPPINGS
 
     def get_configuration(self) -> Dict[str, Any]:
         """
@@ -309,7 +507,7 @@ class SemanticMatcher(BaseMatcher):
         Returns:
             Dictionary of all concept mappings
         """
-        return self._mappings.copy()
+        return {concept: list(variations) for concept, variations in self._mappings.items()}
 
     def add_concept_mapping(self, concept: str, variations: List[str]) -> None:
         """
@@ -9,8 +9,10 @@ with the new BaseMatcher interface and implementations.
 import pandas as pd
 import json
 import os
+import copy
 import datetime
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import asdict
@@ -20,6 +22,9 @@ from cde_matcher.core.matchers import (
 )
 from cde_matcher.core.data_adapter import get_data_adapter, get_data_paths
 
+# Fuzzy confidence at which a source field counts as covered (see skip_covered_sources)
+COVERED_FUZZY_CONFIDENCE = 0.95
+
 
 def extract_variables_flexible(df: pd.DataFrame,
                              method: str = "columns",
@@ -68,12 +73,16 @@ def generate_config_hash(exact_config: Dict[str, Any],
                         source_method: str,
                         source_column: Optional[str],
                         target_method: str,
-                        target_column: str) -> str:
+                        target_column: str,
+                        data_digest: Optional[str] = None,
+                        skip_covered_sources: bool = False) -> str:
     """
     Generate a short hash based on configuration parameters.
 
     This ensures that identical configurations produce the same filename,
-    while different configurations get different files.
+    while different configurations get different files. When data_digest is
+    given (see generate_data_digest), changed input data also gets a new file.
+    Runs that skip covered sources get their own files as well.
     """
     config_data = {
         'exact': exact_config,
@@ -84,6 +93,10 @@ def generate_config_hash(exact_config: Dict[str, Any],
         'target_method': target_method,
         'target_column': target_column
     }
+    if data_digest is not None:
+        config_data['data'] = data_digest
+    if skip_covered_sources:
+        config_data['skip_covered_sources'] = True
 
     # Create a stable string representation
     config_str = json.dumps(config_data, sort_keys=True)
@@ -93,6 +106,20 @@ def generate_config_hash(exact_config: Dict[str, Any],
     return hash_obj.hexdigest()[:8]  # Use first 8 characters
 
 
+def generate_data_digest(source_fields: List[str], target_items: List[str]) -> str:
+    """
+    Generate a digest of the extracted source fields and target items.
+
+    Matching results depend only on these lists (and the configuration), so the
+    digest identifies the input data without hashing the full DataFrames.
+    """
+    hash_obj = hashlib.md5()
+    for values in (source_fields, target_items):
+        hash_obj.update("\x1f".join(values).encode())
+        hash_obj.update(b"\x1e")
+    return hash_obj.hexdigest()
+
+
 class CDEMatcherPipeline:
     """
     Pipeline for matching CDE fields using multiple algorithms.
@@ -106,6 +133,7 @@ class CDEMatcherPipeline:
         self.exact_matcher = None
         self.fuzzy_matcher = None
         self.semantic_matcher = None
+        self.matcher_configs = None
         self.results = {}
         self.data_adapter = get_data_adapter()
         self.data_paths = get_data_paths()
@@ -117,6 +145,9 @@ class CDEMatcherPipeline:
         """
         Configure the matchers for the pipeline.
 
+        Matchers are only rebuilt when the configuration differs from the one
+        they were created with.
+
         Args:
             exact_config: Configuration for exact matcher
             fuzzy_config: Configuration for fuzzy matcher
@@ -127,11 +158,47 @@ class CDEMatcherPipeline:
         fuzzy_config = fuzzy_config or {"threshold": 0.7, "algorithm": "ratio"}
         semantic_config = semantic_config or {"case_sensitive": False, "exact_only": False}
 
+        matcher_configs = (exact_config, fuzzy_config, semantic_config)
+        if matcher_configs == self.matcher_configs:
+            return
+
         # Create matchers
+        self.matcher_configs = copy.deepcopy(matcher_configs)
         self.exact_matcher = create_matcher("exact", **exact_config)
         self.fuzzy_matcher = create_matcher("fuzzy", **fuzzy_config)
         self.semantic_matcher = create_matcher("semantic", **semantic_config)
 
+    def _load_cached_results(self, output_file: str) -> Optional[Dict[str, Any]]:
+        """
+        Load previously saved results for the same configuration, if present.
+
+        Args:
+            output_file: Output JSON file path the results would be saved to
+
+        Returns:
+            Cached results, or None if there are none or they are unreadable
+        """
+        if not self.data_adapter.file_exists(output_file):
+            return None
+
+        print(f"📋 Found existing results with same configuration: {output_file}")
+        print("🔄 Loading cached results instead of reprocessing...")
+
+        try:
+            cached_results = self.data_adapter.read_json(output_file)
+
+            # Verify the cached results have the expected structure
+            if all(key in cached_results for key in ['exact_matches', 'fuzzy_matches', 'semantic_matches', 'summary']):
+                self.results = cached_results
+                print("✅ Successfully loaded cached results!")
+                return cached_results
+            else:
+                print("⚠️ Cached file format invalid, reprocessing...")
+        except Exception as e:
+            print(f"⚠️ Error reading cached file, reprocessing: {e}")
+
+        return None
+
     def load_data(self, source_path: str, target_path: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Load source and target datasets.
@@ -200,9 +267,8 @@ class CDEMatcherPipeline:
 
         all_matches = []
 
-        for source_field in source_fields:
-            results = self.exact_matcher.match(source_field, target_items)
-
+        # Look up each source field in a single index over the targets
+        for results in self.exact_matcher.match_batch(source_fields, target_items):
             for result in results:
                 match_dict = {
                     'source_field': result.source,
@@ -231,9 +297,8 @@ class CDEMatcherPipeline:
 
         all_matches = []
 
-        for source_field in source_fields:
-            results = self.fuzzy_matcher.match(source_field, target_items)
-
+        # Score all source/target pairs in one batch
+        for results in self.fuzzy_matcher.match_batch(source_fields, target_items):
             for result in results:
                 match_dict = {
                     'source_field': result.source,
@@ -263,9 +328,8 @@ class CDEMatcherPipeline:
 
         all_matches = []
 
-        for source_field in source_fields:
-            results = self.semantic_matcher.match(source_field, target_items)
-
+        # Index concept matches over the targets once for all source fields
+        for results in self.semantic_matcher.match_batch(source_fields, target_items):
             for result in results:
                 match_dict = {
                     'source_field': result.source,
@@ -279,6 +343,51 @@ class CDEMatcherPipeline:
         print(f"Found {len(all_matches)} semantic matches")
         return all_matches
 
+    def run_all_matching(self, source_fields: List[str], target_items: List[str],
+                         skip_covered_sources: bool = False) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run exact, fuzzy and semantic matching.
+
+        By default the three matchers are independent over the same inputs, so
+        each runs in its own thread; rapidfuzz releases the GIL while scoring, so
+        the fuzzy stage overlaps with the other two.
+
+        With skip_covered_sources, the stages run in order instead and each one
+        only sees the source fields not yet covered: fields with an exact match
+        skip fuzzy and semantic matching, and fields with a fuzzy match of at
+        least COVERED_FUZZY_CONFIDENCE also skip semantic matching.
+
+        Args:
+            source_fields: List of source field names
+            target_items: List of target item names
+            skip_covered_sources: Whether later stages skip already covered fields
+
+        Returns:
+            Tuple of (exact_matches, fuzzy_matches, semantic_matches)
+        """
+        if skip_covered_sources:
+            exact_matches = self.run_exact_matching(source_fields, target_items)
+            covered = {match['source_field'] for match in exact_matches}
+
+            fuzzy_matches = self.run_fuzzy_matching(
+                [field for field in source_fields if field not in covered], target_items
+            )
+            covered.update(
+                match['source_field'] for match in fuzzy_matches
+                if match['confidence'] >= COVERED_FUZZY_CONFIDENCE
+            )
+
+            semantic_matches = self.run_semantic_matching(
+                [field for field in source_fields if field not in covered], target_items
+            )
+            return exact_matches, fuzzy_matches, semantic_matches
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            exact_future = executor.submit(self.run_exact_matching, source_fields, target_items)
+            fuzzy_future = executor.submit(self.run_fuzzy_matching, source_fields, target_items)
+            semantic_future = executor.submit(self.run_semantic_matching, source_fields, target_items)
+            return exact_future.result(), fuzzy_future.result(), semantic_future.result()
+
     def run_pipeline(self,
                     source_path: Optional[str] = None,
                     target_path: Optional[str] = None,
@@ -286,7 +395,8 @@ class CDEMatcherPipeline:
                     source_method: str = "columns",
                     source_column: Optional[str] = None,
                     target_method: str = "column_values",
-                    target_column: str = "Item") -> Dict[str, Any]:
+                    target_column: str = "Item",
+                    skip_covered_sources: bool = False) -> Dict[str, Any]:
         """
         Run the complete matching pipeline with flexible variable extraction.
 
@@ -298,6 +408,8 @@ class CDEMatcherPipeline:
             source_column: Column name for source extraction (if method="column_values")
             target_method: How to extract variables from target ("columns" or "column_values")
             target_column: Column name for target extraction (default: "Item")
+            skip_covered_sources: Skip fuzzy/semantic matching for source fields an
+                                  earlier stage already covers (see run_all_matching)
 
         Returns:
             Dictionary containing all match results
@@ -331,11 +443,6 @@ class CDEMatcherPipeline:
             target_method, target_column
         )
 
-        # Run matching algorithms
-        exact_matches = self.run_exact_matching(source_fields, target_items)
-        fuzzy_matches = self.run_fuzzy_matching(source_fields, target_items)
-        semantic_matches = self.run_semantic_matching(source_fields, target_items)
-
         # Generate output filename with smart caching
         if output_file is None:
             # Generate config hash for intelligent file naming
@@ -346,7 +453,9 @@ class CDEMatcherPipeline:
                 source_method,
                 source_column,
                 target_method,
-                target_column
+                target_column,
+                generate_data_digest(source_fields, target_items),
+                skip_covered_sources
             )
 
             source_name = Path(source_path).stem
@@ -356,26 +465,18 @@ class CDEMatcherPipeline:
                 f"{source_name}_{method_suffix}_{config_hash}.json"
             )
 
-        # Check if file already exists with same configuration
-        if self.data_adapter.file_exists(output_file):
-            print(f"📋 Found existing results with same configuration: {output_file}")
-            print("🔄 Loading cached results instead of reprocessing...")
-
-            try:
-                cached_results = self.data_adapter.read_json(output_file)
-
-                # Verify the cached results have the expected structure
-                if all(key in cached_results for key in ['exact_matches', 'fuzzy_matches', 'semantic_matches', 'summary']):
-                    self.results = cached_results
-                    print("✅ Successfully loaded cached results!")
-                    return cached_results
-                else:
-                    print("⚠️ Cached file format invalid, reprocessing...")
-            except Exception as e:
-                print(f"⚠️ Error reading cached file, reprocessing: {e}")
+        # Reuse saved results for the same configuration and input data
+        cached_results = self._load_cached_results(output_file)
+        if cached_results is not None:
+            return cached_results
 
         print(f"🆕 Processing new configuration, will save to: {output_file}")
 
+        # Run matching algorithms
+        exact_matches, fuzzy_matches, semantic_matches = self.run_all_matching(
+            source_fields, target_items, skip_covered_sources
+        )
+
         # Compile results with enhanced metadata
         results = {
             'exact_matches': exact_matches,
@@ -408,7 +509,8 @@ class CDEMatcherPipeline:
             'configuration': {
                 'exact_matcher': self.exact_matcher.get_configuration(),
                 'fuzzy_matcher': self.fuzzy_matcher.get_configuration(),
-                'semantic_matcher': self.semantic_matcher.get_configuration()
+                'semantic_matcher': self.semantic_matcher.get_configuration(),
+                'skip_covered_sources': skip_covered_sources
             }
         }
 
@@ -440,7 +542,10 @@ class CDEMatcherPipeline:
                                     source_method: str = "columns",
                                     source_column: Optional[str] = None,
                                     target_method: str = "column_values",
-                                    target_column: str = "Item") -> Dict[str, Any]:
+                                    target_column: str = "Item",
+                                    source_shape: Optional[Tuple[int, int]] = None,
+                                    target_shape: Optional[Tuple[int, int]] = None,
+                                    skip_covered_sources: bool = False) -> Dict[str, Any]:
         """
         Run the complete matching pipeline using DataFrames directly (no file I/O).
 
@@ -454,6 +559,12 @@ class CDEMatcherPipeline:
             source_column: Column name for source extraction (if method="column_values")
             target_method: How to extract variables from target ("columns" or "column_values")
             target_column: Column name for target extraction (default: "Item")
+            source_shape: Shape of the full source dataset, when source_df only
+                         holds the header or the extraction column (default: source_df.shape)
+            target_shape: Shape of the full target dataset, when target_df only
+                         holds the extraction column (default: target_df.shape)
+            skip_covered_sources: Skip fuzzy/semantic matching for source fields an
+                                  earlier stage already covers (see run_all_matching)
 
         Returns:
             Dictionary containing all match results
@@ -476,11 +587,6 @@ class CDEMatcherPipeline:
             target_method, target_column
         )
 
-        # Run matching algorithms
-        exact_matches = self.run_exact_matching(source_fields, target_items)
-        fuzzy_matches = self.run_fuzzy_matching(source_fields, target_items)
-        semantic_matches = self.run_semantic_matching(source_fields, target_items)
-
         # Generate output filename with smart caching
         if output_file is None:
             # Generate config hash for intelligent file naming
@@ -491,7 +597,9 @@ class CDEMatcherPipeline:
                 source_method,
                 source_column,
                 target_method,
-                target_column
+                target_column,
+                generate_data_digest(source_fields, target_items),
+                skip_covered_sources
             )
 
             method_suffix = source_method if source_method == "columns" else source_column
@@ -500,26 +608,18 @@ class CDEMatcherPipeline:
                 f"{source_name}_{method_suffix}_{config_hash}.json"
             )
 
-        # Check if file already exists with same configuration
-        if self.data_adapter.file_exists(output_file):
-            print(f"📋 Found existing results with same configuration: {output_file}")
-            print("🔄 Loading cached results instead of reprocessing...")
-
-            try:
-                cached_results = self.data_adapter.read_json(output_file)
-
-                # Verify the cached results have the expected structure
-                if all(key in cached_results for key in ['exact_matches', 'fuzzy_matches', 'semantic_matches', 'summary']):
-                    self.results = cached_results
-                    print("✅ Successfully loaded cached results!")
-                    return cached_results
-                else:
-                    print("⚠️ Cached file format invalid, reprocessing...")
-            except Exception as e:
-                print(f"⚠️ Error reading cached file, reprocessing: {e}")
+        # Reuse saved results for the same configuration and input data
+        cached_results = self._load_cached_results(output_file)
+        if cached_results is not None:
+            return cached_results
 
         print(f"🆕 Processing new configuration, will save to: {output_file}")
 
+        # Run matching algorithms
+        exact_matches, fuzzy_matches, semantic_matches = self.run_all_matching(
+            source_fields, target_items, skip_covered_sources
+        )
+
         # Compile results with enhanced metadata
         results = {
             'exact_matches': exact_matches,
@@ -538,19 +638,20 @@ class CDEMatcherPipeline:
                 'extraction_method': source_method,
                 'extraction_column': source_column,
                 'variables_extracted': len(source_fields),
-                'dataset_shape': list(source_df.shape)
+                'dataset_shape': list(source_shape or source_df.shape)
             },
             'target_info': {
                 'dataset_name': target_name,
                 'extraction_method': target_method,
                 'extraction_column': target_column,
                 'variables_extracted': len(target_items),
-                'dataset_shape': list(target_df.shape)
+                'dataset_shape': list(target_shape or target_df.shape)
             },
             'configuration': {
                 'exact_matcher': self.exact_matcher.get_configuration(),
                 'fuzzy_matcher': self.fuzzy_matcher.get_configuration(),
-                'semantic_matcher': self.semantic_matcher.get_configuration()
+                'semantic_matcher': self.semantic_matcher.get_configuration(),
+                'skip_covered_sources': skip_covered_sources
             }
         }
 
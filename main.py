@@ -12,22 +12,19 @@ from pathlib import Path
 
 # Import configuration
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from cde_matcher.core.config import config
+from cde_matcher.core.config import get_config
 
 def setup_environment(local_mode: bool = False):
     """Set up environment variables based on mode."""
-    global config
-
     if local_mode:
         os.environ['CDE_LOCAL_MODE'] = 'true'
         print("Running in LOCAL mode - using local data directories")
     else:
         os.environ['CDE_LOCAL_MODE'] = 'false'
-        print(f"Running in CLOUD mode - using GCS bucket: {config.gcs_bucket}")
+        print(f"Running in CLOUD mode - using GCS bucket: {get_config().gcs_bucket}")
 
     # Reload config to pick up environment changes
-    from cde_matcher.core.config import Config
-    config = Config()
+    get_config.cache_clear()
 
 
 def main():
@@ -36,8 +33,8 @@ def main():
     parser.add_argument('--local', action='store_true',
                        help='Use local data paths instead of GCS bucket')
     parser.add_argument('--port', type=int,
-                       default=config.port,
-                       help=f'Port for Streamlit server (default: {config.port})')
+                       default=get_config().port,
+                       help=f'Port for Streamlit server (default: {get_config().port})')
 
     # Parse known args to handle Streamlit's own arguments
     args, unknown_args = parser.parse_known_args()
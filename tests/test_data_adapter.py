@@ -0,0 +1,148 @@
+"""
+Tests for the local CSV readers in cde_matcher.core.data_adapter.
+
+The pyarrow fast path must give the same DataFrame as pd.read_csv, since the
+preview (read with nrows) and chunked statistics still come from pandas.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cde_matcher.core.data_adapter import CSV_SCHEMAS, DataAdapter, _read_csv_file
+
+
+# Every token in pandas' default NA set, plus values that must stay text
+NA_TOKENS_CSV = (
+    'medication,dose,note\n'
+    'None,1,x\n'
+    'NA,,"None"\n'
+    'aspirin,NULL,n/a\n'
+    '#N/A,3.5,null\n'
+    'nan,-1.#IND,<NA>\n'
+    'N/A,2,none\n'
+)
+
+DUPLICATE_HEADER_CSV = 'a,b,a\n1,2,3\n4,5,6\n'
+
+BLANK_HEADER_CSV = 'a,,b\n1,2,3\n'
+
+EMPTY_COLUMN_CSV = 'id,notes,score\n1,,0.5\n2,,0.7\n'
+
+# 20-digit IDs overflow int64 (uint64 and text in pandas)
+WIDE_INTEGER_CSV = 'id,big,score\n12345678901234567890,123456789012345678901234,0.5\n2,-1,0.7\n'
+
+
+class ReadCsvFileTest(unittest.TestCase):
+    """_read_csv_file matches pd.read_csv."""
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self._temp_dir.name, name)
+        with open(path, 'w', newline='') as f:
+            f.write(content)
+        return path
+
+    def assert_matches_pandas(self, path: str, columns=None, dtype=None):
+        pd.testing.assert_frame_equal(_read_csv_file(path, columns, dtype=dtype),
+                                      pd.read_csv(path, usecols=columns, dtype=dtype))
+
+    def test_na_tokens(self):
+        path = self._write('na.csv', NA_TOKENS_CSV)
+        self.assert_matches_pandas(path)
+        self.assert_matches_pandas(path, columns=['medication'])
+
+    def test_na_tokens_as_text(self):
+        self.assert_matches_pandas(self._write('na.csv', NA_TOKENS_CSV), dtype=str)
+
+    def test_duplicate_header(self):
+        path = self._write('dup.csv', DUPLICATE_HEADER_CSV)
+        self.assert_matches_pandas(path)
+        self.assertEqual(list(_read_csv_file(path).columns), ['a', 'b', 'a.1'])
+
+    def test_blank_header(self):
+        self.assert_matches_pandas(self._write('blank.csv', BLANK_HEADER_CSV))
+
+    def test_empty_column(self):
+        path = self._write('empty.csv', EMPTY_COLUMN_CSV)
+        self.assert_matches_pandas(path)
+        self.assert_matches_pandas(path, dtype=str)
+        self.assertEqual(_read_csv_file(path)['notes'].dtype, 'float64')
+
+    def test_wide_integers(self):
+        path = self._write('wide.csv', WIDE_INTEGER_CSV)
+        self.assert_matches_pandas(path)
+        self.assertEqual(_read_csv_file(path)['id'].iloc[0], 12345678901234567890)
+
+    def test_full_read_matches_preview_columns(self):
+        path = self._write('dup.csv', DUPLICATE_HEADER_CSV)
+        adapter = DataAdapter()
+        self.assertEqual(list(adapter.read_csv(path).columns),
+                         adapter.read_csv_metadata(path, include_row_count=False)['columns'])
+
+
+class EnsureParquetTest(unittest.TestCase):
+    """Parquet copies follow the CSV and its CSV_SCHEMAS entry."""
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.path = os.path.join(self._temp_dir.name, 'values.csv')
+        with open(self.path, 'w', newline='') as f:
+            f.write(NA_TOKENS_CSV)
+
+    def test_read_matches_pandas(self):
+        pd.testing.assert_frame_equal(DataAdapter().read_csv(self.path), pd.read_csv(self.path))
+
+    def test_schema_change_rewrites_copy(self):
+        adapter = DataAdapter()
+        adapter.read_csv(self.path)
+        with mock.patch.dict(CSV_SCHEMAS, {'values.csv': {'dtype': str}}):
+            pd.testing.assert_frame_equal(adapter.read_csv(self.path), pd.read_csv(self.path, dtype=str))
+        pd.testing.assert_frame_equal(adapter.read_csv(self.path), pd.read_csv(self.path))
+
+
+class GcsModifiedTimeTest(unittest.TestCase):
+    """GCS modification times come from one cached prefix listing."""
+
+    def setUp(self):
+        updated = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        self.bucket = mock.Mock()
+        self.bucket.list_blobs.return_value = [
+            SimpleNamespace(name=f'data/file{i}.csv', updated=updated) for i in range(3)
+        ]
+        self.bucket.get_blob.return_value = None
+        self.adapter = DataAdapter()
+        self.adapter._gcs_client = mock.Mock(**{'bucket.return_value': self.bucket})
+        self.updated = updated.timestamp()
+
+    def test_listing_serves_all_objects(self):
+        for i in range(3):
+            self.assertEqual(self.adapter.get_modified_time(f'gs://bucket/data/file{i}.csv'), self.updated)
+        self.assertEqual(self.bucket.list_blobs.call_count, 1)
+        self.bucket.get_blob.assert_not_called()
+
+    def test_unlisted_object(self):
+        with self.assertRaises(FileNotFoundError):
+            self.adapter.get_modified_time('gs://bucket/data/missing.csv')
+        self.bucket.get_blob.assert_called_once_with('data/missing.csv')
+
+    def test_invalidate_listings(self):
+        self.adapter.get_modified_time('gs://bucket/data/file0.csv')
+        self.adapter.invalidate_listings('gs://bucket/data/file0.csv')
+        self.adapter.get_modified_time('gs://bucket/data/file0.csv')
+        self.assertEqual(self.bucket.list_blobs.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,244 @@
+"""
+Tests for the matchers in cde_matcher.core.matchers.
+
+The batch and array entry points must give the same results as match(),
+which scores each source against the targets one at a time.
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cde_matcher.core.matchers import ExactMatcher, FuzzyMatcher, MatchResultBatch, SemanticMatcher
+
+
+TARGETS = [
+    'age_at_death', 'Age At Death', 'death_age', 'age_at_onset', 'age', 'sex', 'gender',
+    'participant_id', 'subject id', 'donor_id', 'apoe_genotype', 'APOE', 'braak_stage',
+    'braak score', 'thal_phase', 'mmse_score', 'brain_weight', 'fresh brain weight',
+    'pmi', 'postmortem_interval', 'education_years', 'years of education', 'bmi',
+    'age_at_death', 'biological_sex', 'tobacco use', 'Medication', ' BMI ',
+]
+
+SOURCES = [
+    'age_at_death', 'age at death', 'AGE_DEATH', 'death age', 'Sex', 'gender', 'subject_id',
+    'participant id', 'apoe', 'APOE genotype', 'braak', 'thal', 'mmse', 'brain weight',
+    'post mortem interval', 'years_education', 'body mass index', 'x', 'smoker',
+    'Medication', 'bmi', 'age',
+]
+
+# Matcher configurations covered by the equivalence tests
+MATCHER_CONFIGS = [
+    (ExactMatcher, {'case_sensitive': True}),
+    (ExactMatcher, {'case_sensitive': False}),
+    *[(FuzzyMatcher, {'algorithm': algorithm, 'threshold': threshold})
+      for algorithm in FuzzyMatcher.ALGORITHMS for threshold in (0.0, 0.73, 1.0)],
+    (FuzzyMatcher, {'threshold': 0.6, 'case_sensitive': True, 'max_results': 2}),
+    (SemanticMatcher, {}),
+    (SemanticMatcher, {'exact_only': True}),
+    (SemanticMatcher, {'case_sensitive': True}),
+    (SemanticMatcher, {'custom_mappings': {'sex': ['biological_sex'], 'smoking': ['smoker', 'tobacco']}}),
+]
+
+
+def _configured(matcher_class, config):
+    matcher = matcher_class()
+    matcher.configure(**config)
+    return matcher
+
+
+def fuzzy_reference(matcher, source, targets):
+    """Score every pair with the configured rapidfuzz scorer: (target, confidence) pairs."""
+    config = matcher.get_configuration()
+    scorer = FuzzyMatcher.ALGORITHMS[config['algorithm']]
+    normalize = (lambda text: text) if config['case_sensitive'] else str.lower
+    scored = [(target, scorer(normalize(source), normalize(target)) / 100.0) for target in targets]
+    passing = sorted((pair for pair in scored if pair[1] >= config['threshold']),
+                     key=lambda pair: pair[1], reverse=True)
+    return passing[:config['max_results']]
+
+
+def semantic_reference(matcher, source, targets):
+    """Check every target against every concept: (target, confidence, concept, method) tuples."""
+    config = matcher.get_configuration()
+    case_sensitive, exact_only = config['case_sensitive'], config['exact_only']
+    normalize = (lambda text: text) if case_sensitive else (lambda text: text.lower().strip())
+    mappings = {concept: [variation if case_sensitive else variation.lower() for variation in variations]
+                for concept, variations in matcher.get_available_concepts().items()}
+
+    term = normalize(source)
+    concepts = [concept for concept, variations in mappings.items()
+                if any(variation == term if exact_only else term in variation or variation in term
+                       for variation in variations)]
+
+    results = []
+    for target in targets:
+        target_compare = normalize(target)
+        for concept in concepts:
+            match = None
+            for variation in mappings[concept]:
+                if target_compare == variation:
+                    match = (target, 1.0, concept, 'exact_semantic')
+                elif not exact_only and (target_compare in variation or variation in target_compare):
+                    target_words, var_words = set(target_compare.split()), set(variation.split())
+                    total_words = len(target_words | var_words)
+                    confidence = 0.7 + 0.3 * len(target_words & var_words) / total_words if total_words else 0.7
+                    match = (target, confidence, concept, 'partial_semantic')
+                if match:
+                    break
+            if match:
+                results.append(match)
+                break
+    return sorted(results, key=lambda result: result[1], reverse=True)
+
+
+class MatchBatchTest(unittest.TestCase):
+    """match_batch gives the same results as match() for every source."""
+
+    def test_matches_match(self):
+        for matcher_class, config in MATCHER_CONFIGS:
+            with self.subTest(matcher=matcher_class.__name__, **config):
+                batch_results = _configured(matcher_class, config).match_batch(SOURCES, TARGETS)
+                matcher = _configured(matcher_class, config)
+                self.assertEqual(batch_results, [matcher.match(source, TARGETS) for source in SOURCES])
+
+    def test_empty_sources(self):
+        for matcher_class, config in MATCHER_CONFIGS:
+            self.assertEqual(_configured(matcher_class, config).match_batch([], TARGETS), [])
+
+
+class FuzzyMatcherTest(unittest.TestCase):
+    """FuzzyMatcher's coarse uint8 pass and rescoring keep every pair a direct scorer call accepts."""
+
+    def test_matches_reference(self):
+        for matcher_class, config in MATCHER_CONFIGS:
+            if matcher_class is not FuzzyMatcher:
+                continue
+            matcher = _configured(matcher_class, config)
+            for source in SOURCES:
+                with self.subTest(source=source, **config):
+                    self.assertEqual([(result.target, result.confidence) for result in matcher.match(source, TARGETS)],
+                                     fuzzy_reference(matcher, source, TARGETS))
+
+    def test_best_matches(self):
+        matcher = _configured(FuzzyMatcher, {'threshold': 0.5})
+        for source in SOURCES:
+            with self.subTest(source=source):
+                expected = sorted(matcher.match(source, TARGETS), key=lambda result: -result.confidence)[:3]
+                self.assertEqual([(result.target, result.confidence)
+                                  for result in matcher.get_best_matches(source, TARGETS, limit=3)],
+                                 [(result.target, result.confidence) for result in expected])
+
+
+class SemanticMatcherTest(unittest.TestCase):
+    """SemanticMatcher's indexes find the matches of a direct check of every target and concept."""
+
+    def test_matches_reference(self):
+        for matcher_class, config in MATCHER_CONFIGS:
+            if matcher_class is not SemanticMatcher:
+                continue
+            matcher = _configured(matcher_class, config)
+            for source in SOURCES:
+                with self.subTest(source=source, **config):
+                    self.assertEqual([(result.target, result.confidence, result.metadata['concept'],
+                                       result.metadata['match_method']) for result in matcher.match(source, TARGETS)],
+                                     semantic_reference(matcher, source, TARGETS))
+
+    def test_custom_mappings(self):
+        matcher = _configured(SemanticMatcher, {'custom_mappings': {'smoking': ['smoker', 'tobacco']}})
+        self.assertEqual([result.target for result in matcher.match('smoker', TARGETS)], ['tobacco use'])
+        self.assertEqual(_configured(SemanticMatcher, {}).match('smoker', TARGETS), [])
+
+    def test_exact_only(self):
+        matcher = _configured(SemanticMatcher, {'exact_only': True})
+        results = matcher.match('gender', TARGETS)
+        self.assertEqual([result.target for result in results], ['sex', 'gender'])
+        self.assertTrue(all(result.metadata['match_method'] == 'exact_semantic' for result in results))
+
+
+class TargetCacheTest(unittest.TestCase):
+    """Data derived from a target list is rebuilt when the list is mutated in place."""
+
+    def test_in_place_mutation(self):
+        for matcher_class, config in MATCHER_CONFIGS:
+            with self.subTest(matcher=matcher_class.__name__, **config):
+                matcher = _configured(matcher_class, config)
+                targets = list(TARGETS)
+                matcher.match_batch(SOURCES, targets)
+                targets[0] = 'birth_date'
+                targets.append('death age')
+                self.assertEqual(matcher.match_batch(SOURCES, targets),
+                                 _configured(matcher_class, config).match_batch(SOURCES, list(targets)))
+
+    def test_reconfigure(self):
+        matcher = _configured(FuzzyMatcher, {'threshold': 0.8})
+        matcher.match('Age At Death', TARGETS)
+        matcher.configure(threshold=0.8, case_sensitive=True)
+        self.assertEqual(matcher.match('Age At Death', TARGETS),
+                         _configured(FuzzyMatcher, {'threshold': 0.8, 'case_sensitive': True})
+                         .match('Age At Death', TARGETS))
+
+
+class FuzzyLshTest(unittest.TestCase):
+    """lsh_threshold only narrows the targets scored by match_batch."""
+
+    def setUp(self):
+        try:
+            import datasketch  # noqa: F401
+        except ImportError:
+            self.skipTest('datasketch is not installed')
+        self.matcher = _configured(FuzzyMatcher, {'threshold': 0.7, 'lsh_threshold': 0.5})
+
+    def test_match_unaffected(self):
+        reference = _configured(FuzzyMatcher, {'threshold': 0.7})
+        for source in SOURCES:
+            with self.subTest(source=source):
+                self.assertEqual(self.matcher.match(source, TARGETS), reference.match(source, TARGETS))
+
+    def test_batch_subset_of_match(self):
+        for source, batch_results in zip(SOURCES, self.matcher.match_batch(SOURCES, TARGETS)):
+            with self.subTest(source=source):
+                pairs = [(result.target, result.confidence) for result in self.matcher.match(source, TARGETS)]
+                for result in batch_results:
+                    self.assertIn((result.target, result.confidence), pairs)
+
+    def test_batch_can_miss_matches(self):
+        self.assertIn('age_at_death', [result.target for result in self.matcher.match('age at death', TARGETS)])
+        self.assertNotIn('age_at_death',
+                         [result.target for result in self.matcher.match_batch(['age at death'], TARGETS)[0]])
+
+
+class FuzzyMatchArraysTest(unittest.TestCase):
+    """FuzzyMatcher.match_arrays returns the matches of match() as arrays."""
+
+    def test_matches_match(self):
+        for algorithm in FuzzyMatcher.ALGORITHMS:
+            for threshold in (0.0, 0.73, 1.0):
+                matcher = FuzzyMatcher()
+                matcher.configure(threshold=threshold, algorithm=algorithm, verbose_metadata=False)
+                for source in SOURCES:
+                    with self.subTest(algorithm=algorithm, threshold=threshold, source=source):
+                        batch = matcher.match_arrays(source, TARGETS)
+                        self.assertIsInstance(batch, MatchResultBatch)
+                        self.assertEqual(batch.to_list(), matcher.match(source, TARGETS))
+
+    def test_max_results(self):
+        matcher = FuzzyMatcher()
+        matcher.configure(threshold=0.3, max_results=3, verbose_metadata=False)
+        self.assertEqual(matcher.match_arrays('age_at_death', TARGETS).to_list(),
+                         matcher.match('age_at_death', TARGETS))
+
+    def test_quantized_confidence(self):
+        matcher = FuzzyMatcher()
+        matcher.configure(threshold=0.5)
+        batch = matcher.match_arrays('age_at_death', TARGETS)
+        quantized = batch.quantized_confidence()
+        self.assertEqual(quantized.dtype, np.uint8)
+        np.testing.assert_array_equal(quantized, np.rint(batch.confidence * 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
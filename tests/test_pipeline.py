@@ -0,0 +1,54 @@
+"""
+Tests for CDEMatcherPipeline in cde_matcher.core.pipeline.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cde_matcher.core.pipeline import CDEMatcherPipeline
+
+
+SOURCES = ['age_at_death', 'Sex', 'death age', 'gender']
+
+TARGETS = ['age_at_death', 'sex', 'death_age', 'gender', 'biological_sex']
+
+
+def _source_fields(matches):
+    return {match['source_field'] for match in matches}
+
+
+class RunAllMatchingTest(unittest.TestCase):
+    """run_all_matching runs every stage over every field unless covered fields are skipped."""
+
+    def setUp(self):
+        self.pipeline = CDEMatcherPipeline()
+        self.pipeline.configure_matchers()
+
+    def _run(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.pipeline.run_all_matching(SOURCES, TARGETS, **kwargs)
+
+    def test_all_fields_reach_every_stage(self):
+        exact_matches, fuzzy_matches, semantic_matches = self._run()
+        self.assertIn('age_at_death', _source_fields(exact_matches))
+        self.assertIn('age_at_death', _source_fields(fuzzy_matches))
+        self.assertIn('age_at_death', _source_fields(semantic_matches))
+
+    def test_exact_match_skips_later_stages(self):
+        exact_matches, fuzzy_matches, semantic_matches = self._run(skip_covered_sources=True)
+        covered = _source_fields(exact_matches)
+        self.assertEqual(covered, {'age_at_death', 'Sex', 'gender'})
+        self.assertFalse(covered & _source_fields(fuzzy_matches))
+        self.assertFalse(covered & _source_fields(semantic_matches))
+        self.assertIn('death age', _source_fields(fuzzy_matches))
+
+    def test_exact_matches_unchanged(self):
+        self.assertEqual(self._run(skip_covered_sources=True)[0], self._run()[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ import hashlib
 
 # Add path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from cde_matcher.core.config import config
+from cde_matcher.core.config import get_config
 
 
 def hash_password(password: str) -> str:
@@ -23,7 +23,7 @@ def check_password() -> bool:
     Shows login form if not authenticated.
     """
     # If no password hash configured, skip authentication
-    if not config.is_authenticated:
+    if not get_config().is_authenticated:
         return True
 
     # Check if already authenticated
@@ -39,9 +39,9 @@ def check_password() -> bool:
         submit = st.form_submit_button("Login")
 
         if submit:
-            if hash_password(password) == config.password_hash:
+            if hash_password(password) == get_config().password_hash:
                 st.session_state.authenticated = True
-                st.success("Authentication successful!")
+                st.toast("Authentication successful!", icon="✅")
                 st.rerun()
             else:
                 st.error("Incorrect password")
@@ -66,7 +66,6 @@ def generate_password_hash(password: str) -> str:
 
 if __name__ == "__main__":
     # Utility to generate password hash
-    import sys
     if len(sys.argv) > 1:
         password = sys.argv[1]
         print(f"Password hash for '{password}': {generate_password_hash(password)}")
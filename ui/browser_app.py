@@ -5,12 +5,12 @@ A modern interface for CDE matching with modular components.
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
-import json
 import os
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Import our pipeline and components
 import sys
@@ -26,6 +26,7 @@ from ui.components import (
     ReportBuilder
 )
 from ui.auth import check_password, logout
+from ui.data_cache import load_csv_metadata, load_csv_scan, load_json, load_json_key, list_files, refresh_file_lists
 
 # Configure Streamlit page
 st.set_page_config(
@@ -75,13 +76,28 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def _loader_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs background data loads, shared across reruns and sessions."""
+    return ThreadPoolExecutor(max_workers=3)
+
+
+def _run_in_script_context(ctx, fn, *args):
+    """Run a function on a loader thread with the submitting script run's context attached."""
+    add_script_run_ctx(None, ctx)
+    return fn(*args)
+
+
 class CDEBrowserApp:
     """Main CDE Browser Application."""
 
     def __init__(self):
         self.data_adapter = get_data_adapter()
         self.data_paths = get_data_paths()
-        self.pipeline = CDEMatcherPipeline()
+        # Keep one pipeline per session so matchers survive reruns
+        if 'pipeline' not in st.session_state:
+            st.session_state.pipeline = CDEMatcherPipeline()
+        self.pipeline = st.session_state.pipeline
         self.dataset_selector = DatasetSelector()
         self.matcher_config = MatcherConfig()
         self.results_viewer = ResultsViewer()
@@ -98,29 +114,44 @@ class CDEBrowserApp:
             st.session_state.processing_complete = False
         if 'selected_matches' not in st.session_state:
             st.session_state.selected_matches = []
-        if 'source_data' not in st.session_state:
-            st.session_state.source_data = None
-        if 'target_data' not in st.session_state:
-            st.session_state.target_data = None
         if 'current_dataset' not in st.session_state:
             st.session_state.current_dataset = None
 
         # Initialize matcher configuration
         MatcherConfig.initialize_session_config()
 
+    @staticmethod
+    def _clear_dataset_state():
+        """
+        Clear the current dataset, its results and selections from session state.
+
+        Defaults are restored by _initialize_session_state on the next rerun.
+        """
+        for key in ('results', 'processing_complete', 'selected_matches', 'current_dataset',
+                    'extraction_method', 'extraction_column', 'show_change_dataset_confirmation'):
+            st.session_state.pop(key, None)
+
     def get_cached_outputs(self) -> List[str]:
         """Get list of cached output JSON files."""
-        return self.data_adapter.list_files(self.data_paths['output'], "*.json")
+        return list_files(self.data_paths['output'], "*.json")
 
     def load_cached_output(self, filename: str) -> tuple:
         """Load a cached output JSON file."""
         try:
             file_path = self.data_adapter.get_full_path(self.data_paths['output'], filename)
-            data = self.data_adapter.read_json(file_path)
+            data = load_json(file_path)
             return data, None
         except Exception as e:
             return None, str(e)
 
+    def load_cached_output_summary(self, filename: str) -> tuple:
+        """Load only the summary section of a cached output JSON file."""
+        try:
+            file_path = self.data_adapter.get_full_path(self.data_paths['output'], filename)
+            return load_json_key(file_path, 'summary'), None
+        except Exception as e:
+            return None, str(e)
+
     def render_sidebar(self) -> str:
         """Render sidebar navigation and configuration."""
         with st.sidebar:
@@ -157,6 +188,16 @@ class CDEBrowserApp:
             help="Choose previously processed results to view"
         )
 
+        # Preview the summary without loading the match lists
+        summary, _ = self.load_cached_output_summary(selected_file)
+        if summary:
+            st.caption(
+                f"{summary.get('unique_source_fields', 0)} variables · "
+                f"{summary.get('total_exact_matches', 0)} exact, "
+                f"{summary.get('total_fuzzy_matches', 0)} fuzzy, "
+                f"{summary.get('total_semantic_matches', 0)} semantic matches"
+            )
+
         if st.button("📥 Load Results", type="primary"):
             results, error = self.load_cached_output(selected_file)
             if error:
@@ -167,7 +208,7 @@ class CDEBrowserApp:
                 st.session_state.results = results
                 st.session_state.processing_complete = True
                 st.session_state.selected_matches = []  # Reset selections
-                st.success(f"✅ Loaded results from {selected_file}")
+                st.toast(f"Loaded results from {selected_file}", icon="✅")
                 st.rerun()
 
         return "📊 Select Data"
@@ -186,12 +227,7 @@ class CDEBrowserApp:
 
                 if self.dataset_selector.render_change_dataset_button(has_results=True):
                     # Reset to data selection
-                    st.session_state.processing_complete = False
-                    st.session_state.results = None
-                    st.session_state.selected_matches = []
-                    st.session_state.source_data = None
-                    st.session_state.target_data = None
-                    st.session_state.current_dataset = None
+                    self._clear_dataset_state()
                     st.rerun()
 
             st.divider()
@@ -230,31 +266,49 @@ class CDEBrowserApp:
         """Render the data selection and processing page."""
         st.header("🚀 CDE Matcher - Data Selection")
 
+        cde_path = self.data_adapter.get_full_path(
+            self.data_paths['cdes'],
+            'digipath_cdes.csv'
+        )
+
+        # List clinical data files in the background; once a file is selected, read the
+        # DigiPath CDEs alongside it (separate GCS round trips) while the dataset loads.
+        # The selectbox value is in session state from the start of the run, so a
+        # loaded dataset always comes with these futures.
+        executor = _loader_executor()
+        ctx = get_script_run_ctx()
+        files_future = executor.submit(_run_in_script_context, ctx, self.dataset_selector.get_clinical_data_files)
+        if st.session_state.get(DatasetSelector.FILE_SELECT_KEY) is not None:
+            cde_scan_future = executor.submit(_run_in_script_context, ctx, load_csv_scan, cde_path, ['Item'])
+            cde_metadata_future = executor.submit(_run_in_script_context, ctx, load_csv_metadata, cde_path)
+
         # Dataset selection flow
-        result = self.dataset_selector.render_dataset_selection_flow()
+        result = self.dataset_selector.render_dataset_selection_flow(files_future.result())
         df, filename, method, column_name = result
 
         if df is None:
             return
 
-        # Load DigiPath CDEs
+        # Load DigiPath CDE items; matching only needs the 'Item' column, read as strings
         try:
-            cde_path = self.data_adapter.get_full_path(
-                self.data_paths['cdes'],
-                'digipath_cdes.csv'
-            )
-            target_df = self.data_adapter.read_csv(cde_path)
-            st.success(f"✅ Loaded DigiPath CDEs: {len(target_df)} items")
+            cde_scan = cde_scan_future.result()
+            cde_items = cde_scan['column_values']['Item']
+            cde_shape = (cde_scan['n_rows'], len(cde_metadata_future.result()['columns']))
+            st.success(f"✅ Loaded DigiPath CDEs: {len(cde_items)} items")
         except Exception as e:
             st.error(f"❌ Error loading DigiPath CDEs: {e}")
             return
 
-        # Store data in session state
-        st.session_state.source_data = df
-        st.session_state.target_data = target_df
-        st.session_state.current_dataset = filename
-        st.session_state.extraction_method = method
-        st.session_state.extraction_column = column_name
+        # Record the selection in session state; the DataFrames themselves stay in
+        # the data cache rather than being re-stored on every rerun
+        selection = {
+            'current_dataset': filename,
+            'extraction_method': method,
+            'extraction_column': column_name
+        }
+        for key, value in selection.items():
+            if st.session_state.get(key) != value:
+                st.session_state[key] = value
 
         st.divider()
 
@@ -265,11 +319,12 @@ class CDEBrowserApp:
 
         # Start processing button
         if st.button("🚀 Start Matching Process", type="primary"):
-            self._run_matching_process(df, target_df, filename, method, column_name, config)
+            self._run_matching_process(df, pd.DataFrame({'Item': cde_items}), filename, method, column_name,
+                                       config, target_shape=cde_shape)
 
     def _run_matching_process(self, source_df: pd.DataFrame, target_df: pd.DataFrame,
                             source_name: str, method: str, column_name: Optional[str],
-                            config: Dict[str, Any]):
+                            config: Dict[str, Any], target_shape: Optional[Tuple[int, int]] = None):
         """Run the matching process."""
 
         with st.spinner("🔄 Processing matches..."):
@@ -288,7 +343,10 @@ class CDEBrowserApp:
                     source_name=Path(source_name).stem,
                     target_name="digipath_cdes",
                     source_method=method,
-                    source_column=column_name
+                    source_column=column_name,
+                    source_shape=self.dataset_selector.get_dataset_shape(source_name),
+                    target_shape=target_shape,
+                    skip_covered_sources=config['pipeline']['skip_covered_sources']
                 )
 
                 # Store results
@@ -296,7 +354,10 @@ class CDEBrowserApp:
                 st.session_state.processing_complete = True
                 st.session_state.selected_matches = []  # Reset selections
 
-                st.success("✅ Matching completed successfully!")
+                # Show the new output in the cached results list right away
+                refresh_file_lists(self.data_paths['output'])
+
+                st.toast("Matching completed successfully!", icon="✅")
                 st.rerun()
 
             except Exception as e:
@@ -7,17 +7,26 @@ Handles dataset selection, preview, and extraction method configuration.
 import streamlit as st
 import pandas as pd
 import os
+import re
 import sys
 from typing import Dict, List, Any, Optional, Tuple
 
 # Add path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from cde_matcher.core.data_adapter import get_data_adapter, get_data_paths
+from cde_matcher.core.pipeline import extract_variables_flexible
+from ui.data_cache import load_csv, load_csv_metadata, load_csv_scan, load_column_values, load_column_stats, list_files
+
+# Column names containing any of these keywords may hold variable names
+_VAR_COL_RE = re.compile(r'variable|field|item|name', re.IGNORECASE)
 
 
 class DatasetSelector:
     """Component for selecting and configuring datasets."""
 
+    # Session state key of the clinical data file selectbox
+    FILE_SELECT_KEY = "clinical_data_file"
+
     def __init__(self):
         self.data_adapter = get_data_adapter()
         self.data_paths = get_data_paths()
@@ -25,44 +34,94 @@ class DatasetSelector:
 
     def get_clinical_data_files(self) -> List[str]:
         """Get list of available clinical data files."""
-        return self.data_adapter.list_files(self.clinical_data_dir, "*.csv")
+        return list_files(self.clinical_data_dir, "*.csv")
 
-    def load_clinical_data_file(self, filename: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
-        """Load a specific clinical data file."""
+    def load_clinical_data_file(self, filename: str,
+                                columns: Optional[List[str]] = None) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """Load a specific clinical data file (optionally only a subset of columns)."""
         try:
             file_path = self.data_adapter.get_full_path(self.clinical_data_dir, filename)
-            df = self.data_adapter.read_csv(file_path)
+            df = load_csv(file_path, columns=columns)
             return df, None
         except Exception as e:
             return None, str(e)
 
-    def analyze_dataset_structure(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze dataset structure to suggest extraction methods."""
+    def load_clinical_data_metadata(self, filename: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Load header, preview rows, row count and candidate column values of a clinical data file.
+
+        The preview comes from the leading rows; the row count and the distinct values
+        of columns whose names suggest variable names come from a single chunked scan
+        that parses only those columns.
+        """
+        try:
+            file_path = self.data_adapter.get_full_path(self.clinical_data_dir, filename)
+            metadata = load_csv_metadata(file_path)
+            columns = pd.Index(metadata['columns'])
+            candidate_columns = columns[columns.str.contains(_VAR_COL_RE)].tolist()
+            scan = load_csv_scan(file_path, candidate_columns)
+            return {**metadata, 'n_rows': scan['n_rows'], 'column_values': scan['column_values']}, None
+        except Exception as e:
+            return None, str(e)
+
+    def get_dataset_shape(self, filename: str) -> Optional[Tuple[int, int]]:
+        """Get (rows, columns) of a clinical data file from its metadata."""
+        metadata, error = self.load_clinical_data_metadata(filename)
+        if error:
+            return None
+        return metadata['n_rows'], len(metadata['columns'])
+
+    def load_extraction_data(self, filename: str, metadata: Dict[str, Any],
+                             method: str, column: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """
+        Load only the data the chosen extraction method needs.
+
+        The 'columns' method needs nothing beyond the header, so a header-only
+        DataFrame is returned; 'column_values' uses the distinct values collected by
+        the metadata scan, or streams the selected column if it was not scanned.
+        """
+        if method == 'columns':
+            return pd.DataFrame(columns=metadata['columns']), None
+        if column is None:
+            return None, "column_name is required when method='column_values'"
+        if column in metadata['column_values']:
+            return pd.DataFrame({column: metadata['column_values'][column]}), None
+        try:
+            file_path = self.data_adapter.get_full_path(self.clinical_data_dir, filename)
+            return pd.DataFrame({column: load_column_values(file_path, column)}), None
+        except Exception as e:
+            return None, str(e)
+
+    def analyze_dataset_structure(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze dataset structure to suggest extraction methods.
+
+        Uses the distinct values of candidate columns collected by load_clinical_data_metadata.
+        """
         analysis = {
-            'shape': df.shape,
-            'columns': list(df.columns),
-            'dtypes': df.dtypes.to_dict(),
-            'null_counts': df.isnull().sum().to_dict(),
-            'unique_counts': df.nunique().to_dict(),
+            'shape': (metadata['n_rows'], len(metadata['columns'])),
+            'columns': metadata['columns'],
+            'dtypes': metadata['dtypes'],
             'suggested_method': 'columns',
             'potential_variable_columns': []
         }
 
+        column_values = metadata['column_values']
+        if not column_values:
+            return analysis
+
         # Look for columns that might contain variable names
-        for col in df.columns:
-            col_lower = col.lower()
-            unique_count = df[col].nunique()
-            total_count = len(df)
-
-            # Check for common variable name columns
-            if any(keyword in col_lower for keyword in ['variable', 'field', 'item', 'name']):
-                if unique_count > total_count * 0.5:  # More than 50% unique values
-                    analysis['potential_variable_columns'].append({
-                        'column': col,
-                        'unique_values': unique_count,
-                        'sample_values': df[col].dropna().head(5).tolist(),
-                        'reason': f'Column name suggests variables ({col_lower})'
-                    })
+        unique_counts = pd.Series({col: len(values) for col, values in column_values.items()})
+        mostly_unique = unique_counts[unique_counts > metadata['n_rows'] * 0.5]  # More than 50% unique values
+        analysis['potential_variable_columns'] = [
+            {
+                'column': col,
+                'unique_values': int(unique_count),
+                'sample_values': column_values[col][:5],
+                'reason': f'Column name suggests variables ({col.lower()})'
+            }
+            for col, unique_count in mostly_unique.items()
+        ]
 
         # If we found potential variable columns, suggest column_values method
         if analysis['potential_variable_columns']:
@@ -74,20 +133,17 @@ class DatasetSelector:
     def preview_variable_extraction(self, df: pd.DataFrame, method: str, column: str = None) -> Tuple[List[str], int, Optional[str]]:
         """Preview what variables would be extracted with given method."""
         try:
-            import sys
-            import os
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            from cde_matcher.core.pipeline import extract_variables_flexible
             variables = extract_variables_flexible(df, method, column)
             return variables[:20], len(variables), None  # Show first 20, total count, no error
         except Exception as e:
             return [], 0, str(e)
 
-    def render_file_selection(self) -> Optional[str]:
-        """Render file selection interface."""
+    def render_file_selection(self, files: Optional[List[str]] = None) -> Optional[str]:
+        """Render file selection interface (listing the clinical data files unless given)."""
         st.subheader("📁 Select Clinical Data File")
 
-        files = self.get_clinical_data_files()
+        if files is None:
+            files = self.get_clinical_data_files()
         if not files:
             data_path_display = self.clinical_data_dir
             st.error(f"No CSV files found in `{data_path_display}` directory.")
@@ -99,45 +155,53 @@ class DatasetSelector:
             options=[None] + files,
             index=0,
             format_func=lambda x: "-- Select a file --" if x is None else x,
+            key=self.FILE_SELECT_KEY,
             help="Select the clinical data file you want to process"
         )
 
         return selected_file
 
-    def render_dataset_preview(self, df: pd.DataFrame, filename: str) -> Dict[str, Any]:
+    def render_dataset_preview(self, metadata: Dict[str, Any], filename: str) -> Dict[str, Any]:
         """Render dataset preview with structure analysis."""
         st.subheader(f"📊 Dataset Preview: {filename}")
 
         # Basic info
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("📈 Rows", df.shape[0])
+            st.metric("📈 Rows", metadata['n_rows'])
         with col2:
-            st.metric("📋 Columns", df.shape[1])
+            st.metric("📋 Columns", len(metadata['columns']))
         with col3:
-            memory_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
-            st.metric("💾 Memory", f"{memory_mb:.1f} MB")
+            st.metric("💾 File Size", f"{metadata['file_size_mb']:.1f} MB")
 
         # Data preview
         with st.expander("👀 Data Preview", expanded=True):
-            st.dataframe(df.head(10), width='stretch')
+            st.dataframe(metadata['preview'], width='stretch')
 
         # Analyze structure
-        analysis = self.analyze_dataset_structure(df)
+        analysis = self.analyze_dataset_structure(metadata)
 
         # Show column information
         with st.expander("📋 Column Information"):
-            col_info = []
-            for col in df.columns:
-                col_info.append({
-                    'Column': col,
-                    'Type': str(df[col].dtype),
-                    'Non-null': df[col].notna().sum(),
-                    'Null %': f"{(df[col].isna().sum() / len(df) * 100):.1f}%",
-                    'Unique': df[col].nunique()
-                })
+            compute_stats = st.checkbox(
+                "Compute null and unique counts (reads the full file)",
+                value=False,
+                key="compute_column_stats"
+            )
 
-            col_df = pd.DataFrame(col_info)
+            col_df = None
+            if compute_stats:
+                try:
+                    file_path = self.data_adapter.get_full_path(self.clinical_data_dir, filename)
+                    col_df = load_column_stats(file_path)
+                except Exception as e:
+                    st.error(f"❌ Error loading file: {e}")
+
+            if col_df is None:
+                col_df = pd.DataFrame({
+                    'Column': metadata['columns'],
+                    'Type': [metadata['dtypes'][col] for col in metadata['columns']]
+                })
             st.dataframe(col_df, hide_index=True, width='stretch')
 
         return analysis
@@ -168,10 +232,12 @@ class DatasetSelector:
         if method == 'column_values':
             # Show potential variable columns if found
             if analysis['potential_variable_columns']:
-                st.write("**Potential variable columns found:**")
+                lines = ["**Potential variable columns found:**"]
                 for pot_col in analysis['potential_variable_columns']:
-                    st.write(f"• **{pot_col['column']}** ({pot_col['unique_values']} unique values)")
-                    st.write(f"  Sample: {', '.join(map(str, pot_col['sample_values'][:3]))}...")
+                    lines.append(f"- **{pot_col['column']}** ({pot_col['unique_values']} unique values)  \n"
+                                 f"  Sample: {', '.join(map(str, pot_col['sample_values'][:3]))}...")
+                # One markdown element instead of two per column
+                st.markdown("\n".join(lines))
 
             # Column selection
             column_name = st.selectbox(
@@ -213,29 +279,36 @@ class DatasetSelector:
                 return True
         return False
 
-    def render_dataset_selection_flow(self) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[str], Optional[str]]:
-        """Render complete dataset selection flow."""
+    def render_dataset_selection_flow(self, files: Optional[List[str]] = None
+                                      ) -> Tuple[Optional[pd.DataFrame], Optional[str], Optional[str], Optional[str]]:
+        """Render complete dataset selection flow (listing the clinical data files unless given)."""
         # File selection
-        selected_file = self.render_file_selection()
+        selected_file = self.render_file_selection(files)
         if not selected_file:
             return None, None, None, None
 
-        # Load and preview dataset
-        df, error = self.load_clinical_data_file(selected_file)
+        # Preview dataset from its header and leading rows
+        metadata, error = self.load_clinical_data_metadata(selected_file)
         if error:
             st.error(f"❌ Error loading file: {error}")
             return None, None, None, None
 
-        if df is None:
-            st.error("❌ Failed to load dataset")
-            return None, None, None, None
-
         # Dataset preview
-        analysis = self.render_dataset_preview(df, selected_file)
+        analysis = self.render_dataset_preview(metadata, selected_file)
 
         # Method selection
         method, column_name = self.render_extraction_method_selection(analysis)
 
+        # Load only what the extraction method needs
+        df, error = self.load_extraction_data(selected_file, metadata, method, column_name)
+        if error:
+            st.error(f"❌ Error loading file: {error}")
+            return None, None, None, None
+
+        if df is None:
+            st.error("❌ Failed to load dataset")
+            return None, None, None, None
+
         # Validate extraction method
         try:
             variables, total_count, error = self.preview_variable_extraction(df, method, column_name)
@@ -7,6 +7,8 @@ Handles configuration of exact, fuzzy, and semantic matching algorithms.
 import streamlit as st
 from typing import Dict, Any
 
+from cde_matcher.core.pipeline import COVERED_FUZZY_CONFIDENCE
+
 
 class MatcherConfig:
     """Component for configuring matcher algorithms."""
@@ -25,14 +27,24 @@ class MatcherConfig:
             'semantic': {
                 'case_sensitive': False,
                 'exact_only': False
+            },
+            'pipeline': {
+                'skip_covered_sources': False
             }
         }
 
     @staticmethod
     def initialize_session_config():
-        """Initialize matcher configuration in session state."""
+        """Initialize matcher configuration in session state (adding sections missing from older sessions)."""
         if 'matcher_config' not in st.session_state:
             st.session_state.matcher_config = MatcherConfig.get_default_config()
+        for section, defaults in MatcherConfig.get_default_config().items():
+            st.session_state.matcher_config.setdefault(section, defaults)
+
+    @staticmethod
+    def _sync_config(matcher: str, option: str):
+        """Copy a widget value into the matcher configuration (widget on_change callback)."""
+        st.session_state.matcher_config[matcher][option] = st.session_state[f"{matcher}_{option}"]
 
     @staticmethod
     def render_exact_matcher_config() -> Dict[str, Any]:
@@ -48,10 +60,10 @@ class MatcherConfig:
                 "Case Sensitive",
                 value=st.session_state.matcher_config['exact']['case_sensitive'],
                 key="exact_case_sensitive",
+                on_change=MatcherConfig._sync_config,
+                args=('exact', 'case_sensitive'),
                 help="Enable case-sensitive exact string matching"
             )
-            st.session_state.matcher_config['exact']['case_sensitive'] = case_sensitive
-
             # Show example
             with st.expander("💡 Examples"):
                 if case_sensitive:
@@ -77,6 +89,8 @@ class MatcherConfig:
                 value=st.session_state.matcher_config['fuzzy']['threshold'],
                 step=0.05,
                 key="fuzzy_threshold",
+                on_change=MatcherConfig._sync_config,
+                args=('fuzzy', 'threshold'),
                 help="Minimum similarity score to consider a match (0.0 = any similarity, 1.0 = exact match)"
             )
 
@@ -87,6 +101,8 @@ class MatcherConfig:
                     st.session_state.matcher_config['fuzzy']['algorithm']
                 ),
                 key="fuzzy_algorithm",
+                on_change=MatcherConfig._sync_config,
+                args=('fuzzy', 'algorithm'),
                 help="Choose the fuzzy matching algorithm"
             )
 
@@ -131,12 +147,10 @@ class MatcherConfig:
                         ("'mmse_total'", "'mmse'", 0.76)
                     ]
 
-                for src, tgt, score in example_pairs:
-                    color = "🟢" if score >= threshold else "🔴"
-                    st.write(f"{color} {src} ↔ {tgt} = {score:.2f}")
-
-            st.session_state.matcher_config['fuzzy']['threshold'] = threshold
-            st.session_state.matcher_config['fuzzy']['algorithm'] = algorithm
+                st.markdown("  \n".join(
+                    f"{'🟢' if score >= threshold else '🔴'} {src} ↔ {tgt} = {score:.2f}"
+                    for src, tgt, score in example_pairs
+                ))
 
         return st.session_state.matcher_config['fuzzy']
 
@@ -150,23 +164,24 @@ class MatcherConfig:
             Best for: Different terms that refer to the same concept.
             """)
 
-            case_sensitive = st.checkbox(
+            st.checkbox(
                 "Case Sensitive",
                 value=st.session_state.matcher_config['semantic']['case_sensitive'],
                 key="semantic_case_sensitive",
+                on_change=MatcherConfig._sync_config,
+                args=('semantic', 'case_sensitive'),
                 help="Enable case-sensitive semantic matching"
             )
 
-            exact_only = st.checkbox(
+            st.checkbox(
                 "Exact Semantic Only",
                 value=st.session_state.matcher_config['semantic']['exact_only'],
                 key="semantic_exact_only",
+                on_change=MatcherConfig._sync_config,
+                args=('semantic', 'exact_only'),
                 help="Only return exact concept matches, not partial ones"
             )
 
-            st.session_state.matcher_config['semantic']['case_sensitive'] = case_sensitive
-            st.session_state.matcher_config['semantic']['exact_only'] = exact_only
-
             # Show available concepts
             with st.expander("📋 Available Semantic Concepts"):
                 st.markdown("""
@@ -199,11 +214,26 @@ class MatcherConfig:
                     ("'apoe_status'", "['APOE_genotype', 'APOE4_status']")
                 ]
 
-                for source, targets in examples:
-                    st.write(f"🔗 {source} → {targets}")
+                st.markdown("  \n".join(f"🔗 {source} → {targets}" for source, targets in examples))
 
         return st.session_state.matcher_config['semantic']
 
+    @staticmethod
+    def render_pipeline_config() -> Dict[str, Any]:
+        """Render pipeline options shared by all matchers."""
+        st.checkbox(
+            "Skip fields already matched",
+            value=st.session_state.matcher_config['pipeline']['skip_covered_sources'],
+            key="pipeline_skip_covered_sources",
+            on_change=MatcherConfig._sync_config,
+            args=('pipeline', 'skip_covered_sources'),
+            help=f"Fields with an exact match skip fuzzy and semantic matching, and fields with a "
+                 f"fuzzy match of at least {COVERED_FUZZY_CONFIDENCE} skip semantic matching "
+                 f"(faster, but fewer alternatives to review)"
+        )
+
+        return st.session_state.matcher_config['pipeline']
+
     @staticmethod
     def render_configuration_summary() -> Dict[str, Dict[str, Any]]:
         """Render a summary of current configuration."""
@@ -213,18 +243,26 @@ class MatcherConfig:
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                st.write("**Exact Matcher**")
-                st.write(f"• Case sensitive: {config['exact']['case_sensitive']}")
+                st.markdown(
+                    "**Exact Matcher**  \n"
+                    f"• Case sensitive: {config['exact']['case_sensitive']}"
+                )
 
             with col2:
-                st.write("**Fuzzy Matcher**")
-                st.write(f"• Threshold: {config['fuzzy']['threshold']}")
-                st.write(f"• Algorithm: {config['fuzzy']['algorithm']}")
+                st.markdown(
+                    "**Fuzzy Matcher**  \n"
+                    f"• Threshold: {config['fuzzy']['threshold']}  \n"
+                    f"• Algorithm: {config['fuzzy']['algorithm']}"
+                )
 
             with col3:
-                st.write("**Semantic Matcher**")
-                st.write(f"• Case sensitive: {config['semantic']['case_sensitive']}")
-                st.write(f"• Exact only: {config['semantic']['exact_only']}")
+                st.markdown(
+                    "**Semantic Matcher**  \n"
+                    f"• Case sensitive: {config['semantic']['case_sensitive']}  \n"
+                    f"• Exact only: {config['semantic']['exact_only']}"
+                )
+
+            st.markdown(f"**Skip fields already matched:** {config['pipeline']['skip_covered_sources']}")
 
         return config
 
@@ -240,6 +278,7 @@ class MatcherConfig:
         exact_config = MatcherConfig.render_exact_matcher_config()
         fuzzy_config = MatcherConfig.render_fuzzy_matcher_config()
         semantic_config = MatcherConfig.render_semantic_matcher_config()
+        pipeline_config = MatcherConfig.render_pipeline_config()
 
         # Show summary
         all_config = MatcherConfig.render_configuration_summary()
@@ -250,6 +289,10 @@ class MatcherConfig:
     def reset_to_defaults():
         """Reset configuration to defaults."""
         st.session_state.matcher_config = MatcherConfig.get_default_config()
+        # Drop widget state so the widgets pick up the default values
+        for matcher, options in st.session_state.matcher_config.items():
+            for option in options:
+                st.session_state.pop(f"{matcher}_{option}", None)
         st.rerun()
 
     @staticmethod
@@ -6,9 +6,17 @@ Handles manual report creation, conflict resolution, and export functionality.
 
 import streamlit as st
 import pandas as pd
-import json
+import datetime
+import io
+import os
+import sys
+from collections import Counter
 from typing import Dict, List, Any, Tuple
 
+# Add path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cde_matcher.core.data_adapter import dump_json_bytes
+
 
 class ReportBuilder:
     """Component for building and managing manual reports."""
@@ -63,10 +71,15 @@ class ReportBuilder:
         selected_matches = st.session_state.selected_matches
         total_selected = len(selected_matches)
 
-        # Count by match type
-        exact_count = len([s for s in selected_matches if s['match_type'] == 'exact'])
-        fuzzy_count = len([s for s in selected_matches if s['match_type'] == 'fuzzy'])
-        semantic_count = len([s for s in selected_matches if s['match_type'] == 'semantic'])
+        # Count by match type and total confidence in a single pass
+        type_counts = Counter()
+        total_confidence = 0.0
+        for match in selected_matches:
+            type_counts[match['match_type']] += 1
+            total_confidence += match['confidence']
+        exact_count = type_counts['exact']
+        fuzzy_count = type_counts['fuzzy']
+        semantic_count = type_counts['semantic']
 
         col1, col2, col3, col4 = st.columns(4)
 
@@ -81,27 +94,18 @@ class ReportBuilder:
 
         # Show average confidence
         if selected_matches:
-            avg_confidence = sum(match['confidence'] for match in selected_matches) / len(selected_matches)
+            avg_confidence = total_confidence / total_selected
             st.info(f"📈 Average confidence score: {avg_confidence:.3f}")
 
     @staticmethod
     def _detect_conflicts() -> List[str]:
         """Detect variables mapped to multiple CDEs."""
-        variable_mappings = {}
-        conflicts = []
-
-        for match in st.session_state.selected_matches:
-            var = match['variable']
-            cde = match['cde']
-
-            if var in variable_mappings:
-                if variable_mappings[var] != cde:
-                    if var not in conflicts:
-                        conflicts.append(var)
-            else:
-                variable_mappings[var] = cde
+        if not st.session_state.selected_matches:
+            return []
 
-        return conflicts
+        selected_df = pd.DataFrame(st.session_state.selected_matches, columns=['variable', 'cde'])
+        cde_counts = selected_df.groupby('variable', sort=False)['cde'].nunique()
+        return cde_counts[cde_counts > 1].index.tolist()
 
     @staticmethod
     def _render_conflict_resolution(conflicts: List[str]):
@@ -109,31 +113,33 @@ class ReportBuilder:
         st.subheader("⚠️ Conflict Resolution")
         st.warning(f"**{len(conflicts)} variables are mapped to multiple CDEs** - Please resolve before exporting")
 
+        # Group the conflicting selections by variable in one pass
+        conflicts_by_var = {var: [] for var in conflicts}
+        for selected in st.session_state.selected_matches:
+            if selected['variable'] in conflicts_by_var:
+                conflicts_by_var[selected['variable']].append(selected)
+
         with st.expander("🔍 Resolve Conflicts", expanded=True):
-            for var in conflicts:
-                st.write(f"**Variable: `{var}`**")
-                conflicting_matches = [s for s in st.session_state.selected_matches if s['variable'] == var]
+            for var, conflicting_matches in conflicts_by_var.items():
+                # One markdown element per variable and per mapping rather than one per line
+                st.markdown(f"**Variable: `{var}`**  \nChoose which mapping to keep:")
 
                 # Sort by confidence (highest first)
                 conflicting_matches.sort(key=lambda x: x['confidence'], reverse=True)
 
-                st.write("Choose which mapping to keep:")
-
-                for i, match in enumerate(conflicting_matches):
-                    col1, col2, col3, col4 = st.columns([4, 2, 1, 1])
+                for match in conflicting_matches:
+                    col1, col2, col3 = st.columns([6, 1, 1])
 
                     with col1:
                         confidence_color = "🟢" if match['confidence'] >= 0.8 else "🟡" if match['confidence'] >= 0.6 else "🔴"
-                        st.write(f"  {confidence_color} **{match['cde']}**")
+                        st.markdown(f"{confidence_color} **{match['cde']}** — "
+                                    f"Conf: {match['confidence']:.3f} ({match['match_type']})")
 
                     with col2:
-                        st.write(f"Conf: {match['confidence']:.3f} ({match['match_type']})")
-
-                    with col3:
                         if st.button("✅ Keep", key=f"keep_{match['match_id']}", help="Keep this mapping and remove others"):
                             ReportBuilder._resolve_conflict_keep(var, match['match_id'])
 
-                    with col4:
+                    with col3:
                         if st.button("❌ Remove", key=f"remove_{match['match_id']}", help="Remove this mapping"):
                             ReportBuilder._resolve_conflict_remove(match['match_id'])
 
@@ -163,10 +169,11 @@ class ReportBuilder:
         st.subheader("📝 Final Report Data")
 
         # Create clean report data (excluding conflicts)
+        conflicted_vars = set(conflicts)
         report_data = []
         for match in st.session_state.selected_matches:
             # Skip variables that still have conflicts
-            if match['variable'] not in conflicts:
+            if match['variable'] not in conflicted_vars:
                 report_data.append({
                     'CDE': match['cde'],
                     'Variable': match['variable'],
@@ -182,7 +189,7 @@ class ReportBuilder:
             return
 
         # Sort by CDE name for consistency
-        report_df = pd.DataFrame(report_data).sort_values('CDE')
+        report_df = pd.DataFrame(report_data).convert_dtypes(dtype_backend='pyarrow').sort_values('CDE')
 
         # Show summary
         col1, col2 = st.columns([2, 1])
@@ -266,12 +273,11 @@ class ReportBuilder:
         export_df = report_df[['CDE', 'Variable']].copy()
 
         # Generate filename with timestamp
-        import datetime
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"cde_manual_report_{timestamp}.csv"
 
         # Convert to CSV
-        csv_data = export_df.to_csv(index=False)
+        csv_data = ReportBuilder._to_csv_bytes(export_df)
 
         # Provide download
         st.download_button(
@@ -284,6 +290,13 @@ class ReportBuilder:
 
         st.success(f"✅ Report ready for download: {len(export_df)} mappings in {filename}")
 
+    @staticmethod
+    def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+        """Encode a DataFrame as CSV bytes, writing in chunks into a byte buffer."""
+        buffer = io.BytesIO()
+        df.to_csv(buffer, index=False, chunksize=10_000)
+        return buffer.getvalue()
+
     @staticmethod
     def render_export_page(results: Dict[str, Any]):
         """Render comprehensive export options page."""
@@ -309,15 +322,14 @@ class ReportBuilder:
 
         # JSON export
         if st.button("📋 Download Complete Results (JSON)", type="primary"):
-            json_str = json.dumps(results, indent=2)
+            json_bytes = dump_json_bytes(results)
 
-            import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"cde_matching_results_{timestamp}.json"
 
             st.download_button(
                 label="💾 Download JSON",
-                data=json_str,
+                data=json_bytes,
                 file_name=filename,
                 mime="application/json",
                 help="Download complete results with all matches and metadata"
@@ -328,11 +340,10 @@ class ReportBuilder:
             all_matches_df = ReportBuilder._create_all_matches_dataframe(results)
 
             if not all_matches_df.empty:
-                import datetime
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"cde_all_matches_{timestamp}.csv"
 
-                csv_data = all_matches_df.to_csv(index=False)
+                csv_data = ReportBuilder._to_csv_bytes(all_matches_df)
                 st.download_button(
                     label="💾 Download CSV",
                     data=csv_data,
@@ -368,20 +379,26 @@ class ReportBuilder:
     @staticmethod
     def _create_all_matches_dataframe(results: Dict[str, Any]) -> pd.DataFrame:
         """Create DataFrame with all matches from all algorithms."""
-        all_matches = []
+        frames = []
 
         for match_type in ['exact', 'fuzzy', 'semantic']:
             matches = results.get(f"{match_type}_matches", [])
-            for match in matches:
-                all_matches.append({
-                    'Variable Name': match['source_field'],
-                    'DigiPath CDE': match['target_item'],
-                    'Confidence': match['confidence'],
-                    'Match Type': match['match_type'],
-                    'Algorithm': match_type.title()
-                })
-
-        return pd.DataFrame(all_matches) if all_matches else pd.DataFrame()
+            if not matches:
+                continue
+            # Build columns in one pass per algorithm rather than one dict per match
+            df = pd.DataFrame(matches, columns=['source_field', 'target_item', 'confidence', 'match_type'])
+            df['Algorithm'] = match_type.title()
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+
+        return pd.concat(frames, ignore_index=True).rename(columns={
+            'source_field': 'Variable Name',
+            'target_item': 'DigiPath CDE',
+            'confidence': 'Confidence',
+            'match_type': 'Match Type'
+        })
 
     @staticmethod
     def _render_export_summary(results: Dict[str, Any]):
@@ -6,9 +6,18 @@ Handles display and interaction with matching results across all algorithm types
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
+
+# Match fields shown in the match tables, with their display names
+_TABLE_COLUMNS = {
+    'source_field': 'Variable',
+    'target_item': 'DigiPath CDE',
+    'confidence': 'Confidence',
+    'match_type': 'Match Type'
+}
 
 
 class ResultsViewer:
@@ -114,7 +123,9 @@ class ResultsViewer:
         st.subheader("🎯 Match Quality")
 
         if results['fuzzy_matches']:
-            confidences = [match['confidence'] for match in results['fuzzy_matches']]
+            confidences = pd.DataFrame.from_records(
+                results['fuzzy_matches'], columns=['confidence']
+            )['confidence'].to_numpy()
 
             fig = px.histogram(
                 x=confidences,
@@ -125,7 +136,7 @@ class ResultsViewer:
             )
 
             # Add median line
-            median_conf = pd.Series(confidences).median()
+            median_conf = np.median(confidences)
             fig.add_vline(
                 x=median_conf,
                 line_dash="dash",
@@ -177,20 +188,48 @@ class ResultsViewer:
 
         st.header(f"{match_type} Matches ({len(matches)} found)")
 
-        # Apply filters
-        filtered_matches = ResultsViewer._apply_match_filters(matches, match_type)
+        # Build the match table once per result set, then filter it
+        match_frame = ResultsViewer._get_match_frame(matches, match_type)
+        filtered_frame = ResultsViewer._apply_match_filters(match_frame, match_type)
 
         # Display matches with selection
-        selected_matches = ResultsViewer._render_interactive_match_table(filtered_matches, match_type)
+        filtered_matches = [matches[position] for position in filtered_frame.index]
+        selected_matches = ResultsViewer._render_interactive_match_table(filtered_matches, filtered_frame, match_type)
 
         return selected_matches
 
     @staticmethod
-    def _apply_match_filters(matches: List[Dict[str, Any]], match_type: str) -> List[Dict[str, Any]]:
-        """Apply filters to match results."""
+    def _get_match_frame(matches: List[Dict[str, Any]], match_type: str) -> pd.DataFrame:
+        """
+        Get the match table for a list of matches, building it only once per list.
+
+        The frame is kept in session state together with the list it was built
+        from, so reruns reuse it until a different result set is shown. Its index
+        is the position of each match in the list.
+        """
+        cache_key = f"{match_type}_match_frame"
+        cached = st.session_state.get(cache_key)
+        if cached is not None and cached[0] is matches:
+            return cached[1]
+
+        # Arrow-backed columns keep the strings in contiguous buffers for the filters
+        df = (pd.DataFrame.from_records(matches, columns=list(_TABLE_COLUMNS))
+              .rename(columns=_TABLE_COLUMNS)
+              .convert_dtypes(dtype_backend='pyarrow'))
+        df['match_id'] = df['Variable'].str.cat([df['DigiPath CDE'], df['Match Type']], sep='_')
+        # Lowercased copies for the search filter, so typing does not re-lowercase every row
+        df['_variable_lower'] = df['Variable'].str.lower()
+        df['_cde_lower'] = df['DigiPath CDE'].str.lower()
+
+        st.session_state[cache_key] = (matches, df)
+        return df
+
+    @staticmethod
+    def _apply_match_filters(match_frame: pd.DataFrame, match_type: str) -> pd.DataFrame:
+        """Apply filters to the match table."""
         col1, col2, col3 = st.columns(3)
 
-        filtered_matches = matches.copy()
+        filtered_frame = match_frame
 
         with col1:
             if match_type == "Fuzzy":
@@ -200,7 +239,7 @@ class ResultsViewer:
                     value=0.7, step=0.05,
                     key=f"{match_type}_confidence_filter"
                 )
-                filtered_matches = [m for m in filtered_matches if m['confidence'] >= min_confidence]
+                filtered_frame = filtered_frame[filtered_frame['Confidence'] >= min_confidence]
 
         with col2:
             search_term = st.text_input(
@@ -208,50 +247,30 @@ class ResultsViewer:
                 placeholder="Enter source or target name",
                 key=f"{match_type}_search_filter"
             )
-            if search_term:
+            if search_term and not filtered_frame.empty:
                 search_lower = search_term.lower()
-                filtered_matches = [
-                    m for m in filtered_matches
-                    if search_lower in m['source_field'].lower() or
-                       search_lower in m['target_item'].lower()
-                ]
+                mask = (filtered_frame['_variable_lower'].str.contains(search_lower, regex=False) |
+                        filtered_frame['_cde_lower'].str.contains(search_lower, regex=False))
+                filtered_frame = filtered_frame[mask]
 
         with col3:
-            st.write(f"**Showing {len(filtered_matches)} matches**")
-            if len(filtered_matches) < len(matches):
-                st.caption(f"(filtered from {len(matches)} total)")
+            st.write(f"**Showing {len(filtered_frame)} matches**")
+            if len(filtered_frame) < len(match_frame):
+                st.caption(f"(filtered from {len(match_frame)} total)")
 
-        return filtered_matches
+        return filtered_frame
 
     @staticmethod
-    def _render_interactive_match_table(matches: List[Dict[str, Any]], match_type: str) -> List[Dict[str, Any]]:
+    def _render_interactive_match_table(matches: List[Dict[str, Any]], match_frame: pd.DataFrame,
+                                        match_type: str) -> List[Dict[str, Any]]:
         """Render interactive match table with selection capability."""
         if not matches:
             return []
 
-        # Convert matches to DataFrame with selection column
-        df_data = []
-        for i, match in enumerate(matches):
-            # Create unique match ID
-            match_id = f"{match['source_field']}_{match['target_item']}_{match['match_type']}"
-
-            # Check if this match is already selected
-            is_selected = any(
-                selected['match_id'] == match_id
-                for selected in st.session_state.get('selected_matches', [])
-            )
-
-            df_data.append({
-                'Select': is_selected,
-                'Variable': match['source_field'],
-                'DigiPath CDE': match['target_item'],
-                'Confidence': f"{match['confidence']:.3f}",
-                'Match Type': match['match_type'],
-                'match_id': match_id,
-                'full_match': match
-            })
-
-        df = pd.DataFrame(df_data)
+        # Add the selection column to the (filtered) match table
+        df = match_frame.reset_index(drop=True)
+        df['Select'] = df['match_id'].isin(ResultsViewer._selected_match_ids())
+        df['full_match'] = matches
 
         # Interactive data editor
         edited_df = st.data_editor(
@@ -269,50 +288,46 @@ class ResultsViewer:
         ResultsViewer._update_selected_matches(edited_df, df)
 
         # Show bulk selection options
-        ResultsViewer._render_bulk_selection_options(matches, match_type)
+        ResultsViewer._render_bulk_selection_options(df, match_type)
 
         # Return currently selected matches for this type
-        return [
-            row['full_match'] for _, row in df.iterrows()
-            if edited_df.iloc[_]['Select']
-        ]
+        return [match for match, selected in zip(matches, edited_df['Select'].to_numpy(dtype=bool)) if selected]
 
     @staticmethod
     def _update_selected_matches(edited_df: pd.DataFrame, original_df: pd.DataFrame):
-        """Update session state with current selections."""
+        """Update session state with the rows whose selection changed in the editor."""
         if 'selected_matches' not in st.session_state:
             st.session_state.selected_matches = []
 
-        # Get current selections
-        current_selected = {}
-        for idx, row in edited_df.iterrows():
-            match_id = original_df.iloc[idx]['match_id']
-            current_selected[match_id] = row['Select']
+        # Compare the edited checkboxes with the selection the table was rendered with
+        new_selected = edited_df['Select'].to_numpy(dtype=bool)
+        old_selected = original_df['Select'].to_numpy(dtype=bool)
+        to_add = np.flatnonzero(new_selected & ~old_selected)
+        to_remove = np.flatnonzero(~new_selected & old_selected)
 
-        # Update session state - remove deselected, add newly selected
-        st.session_state.selected_matches = [
-            match for match in st.session_state.selected_matches
-            if match['match_id'] not in current_selected or current_selected[match['match_id']]
-        ]
+        # Remove deselected matches
+        if to_remove.size:
+            removed_ids = set(original_df['match_id'].to_numpy()[to_remove])
+            st.session_state.selected_matches = [
+                match for match in st.session_state.selected_matches
+                if match['match_id'] not in removed_ids
+            ]
 
         # Add newly selected matches
-        for idx, row in original_df.iterrows():
-            match_id = row['match_id']
-            if current_selected.get(match_id, False):
-                # Check if not already in selected matches
-                if not any(match['match_id'] == match_id for match in st.session_state.selected_matches):
-                    st.session_state.selected_matches.append({
-                        'match_id': match_id,
-                        'variable': row['full_match']['source_field'],
-                        'cde': row['full_match']['target_item'],
-                        'confidence': row['full_match']['confidence'],
-                        'match_type': row['full_match']['match_type'],
-                        'full_match': row['full_match']
-                    })
+        for position in to_add:
+            match = original_df['full_match'].iat[position]
+            st.session_state.selected_matches.append({
+                'match_id': original_df['match_id'].iat[position],
+                'variable': match['source_field'],
+                'cde': match['target_item'],
+                'confidence': match['confidence'],
+                'match_type': match['match_type'],
+                'full_match': match
+            })
 
     @staticmethod
-    def _render_bulk_selection_options(matches: List[Dict[str, Any]], match_type: str):
-        """Render bulk selection action buttons."""
+    def _render_bulk_selection_options(match_frame: pd.DataFrame, match_type: str):
+        """Render bulk selection action buttons for the matches in the (filtered) match table."""
         st.divider()
         st.subheader("🎛️ Bulk Actions")
 
@@ -320,37 +335,36 @@ class ResultsViewer:
 
         with col1:
             if st.button(f"✅ Select All {match_type}", key=f"select_all_{match_type}"):
-                ResultsViewer._bulk_select_matches(matches, True)
+                ResultsViewer._bulk_select_matches(match_frame, True)
 
         with col2:
             if st.button(f"❌ Deselect All {match_type}", key=f"deselect_all_{match_type}"):
-                ResultsViewer._bulk_select_matches(matches, False)
+                ResultsViewer._bulk_select_matches(match_frame, False)
 
         with col3:
             if match_type == "Fuzzy" and st.button("⭐ Select High Confidence", key=f"select_high_conf_{match_type}"):
-                high_conf_matches = [m for m in matches if m['confidence'] >= 0.8]
-                ResultsViewer._bulk_select_matches(high_conf_matches, True)
+                ResultsViewer._bulk_select_matches(match_frame[match_frame['Confidence'] >= 0.8], True)
 
         with col4:
-            selected_count = len([m for m in matches if ResultsViewer._is_match_selected(m)])
+            selected_count = int(match_frame['match_id'].isin(ResultsViewer._selected_match_ids()).sum())
             st.metric("Selected", selected_count)
 
     @staticmethod
-    def _bulk_select_matches(matches: List[Dict[str, Any]], select: bool):
-        """Bulk select or deselect matches."""
+    def _bulk_select_matches(match_frame: pd.DataFrame, select: bool):
+        """Bulk select or deselect the matches in a match table."""
         if 'selected_matches' not in st.session_state:
             st.session_state.selected_matches = []
 
-        for match in matches:
-            match_id = f"{match['source_field']}_{match['target_item']}_{match['match_type']}"
+        bulk_matches = dict(zip(match_frame['match_id'], match_frame['full_match']))
 
-            # Remove if exists
-            st.session_state.selected_matches = [
-                m for m in st.session_state.selected_matches if m['match_id'] != match_id
-            ]
+        # Remove existing entries for these matches in one pass
+        st.session_state.selected_matches = [
+            m for m in st.session_state.selected_matches if m['match_id'] not in bulk_matches
+        ]
 
-            # Add if selecting
-            if select:
+        # Add if selecting
+        if select:
+            for match_id, match in bulk_matches.items():
                 st.session_state.selected_matches.append({
                     'match_id': match_id,
                     'variable': match['source_field'],
@@ -363,13 +377,9 @@ class ResultsViewer:
         st.rerun()
 
     @staticmethod
-    def _is_match_selected(match: Dict[str, Any]) -> bool:
-        """Check if a match is currently selected."""
-        match_id = f"{match['source_field']}_{match['target_item']}_{match['match_type']}"
-        return any(
-            selected['match_id'] == match_id
-            for selected in st.session_state.get('selected_matches', [])
-        )
+    def _selected_match_ids() -> Set[str]:
+        """Get the IDs of the currently selected matches as a set for O(1) lookups."""
+        return {selected['match_id'] for selected in st.session_state.get('selected_matches', [])}
 
     @staticmethod
     def render_analytics_dashboard(results: Dict[str, Any]):
@@ -388,23 +398,51 @@ class ResultsViewer:
         st.subheader("📊 Coverage Analysis")
         ResultsViewer._render_coverage_analysis(results)
 
+    @staticmethod
+    def _get_result_stats(results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the counters shown on the analytics dashboard, computing them once per result set.
+
+        The statistics are kept in session state together with the results they
+        were computed from, so widget reruns reuse them until new results are shown.
+        """
+        cached = st.session_state.get('result_stats')
+        if cached is not None and cached[0] is results:
+            return cached[1]
+
+        frames = {
+            match_type: pd.DataFrame.from_records(
+                results.get(f"{match_type}_matches", []), columns=['source_field', 'confidence']
+            )
+            for match_type in ['exact', 'fuzzy', 'semantic']
+        }
+
+        fuzzy_confidences = frames['fuzzy']['confidence'].to_numpy()
+        stats = {
+            'counts': {match_type: len(frame) for match_type, frame in frames.items()},
+            'avg_confidence': {
+                match_type: float(frame['confidence'].mean()) if len(frame) else 0
+                for match_type, frame in frames.items()
+            },
+            'fuzzy_confidence_ranges': {
+                'High (≥0.8)': int((fuzzy_confidences >= 0.8).sum()),
+                'Medium (0.6-0.8)': int(((fuzzy_confidences >= 0.6) & (fuzzy_confidences < 0.8)).sum()),
+                'Low (<0.6)': int((fuzzy_confidences < 0.6).sum())
+            },
+            # A field matched by several algorithms (or to several CDEs) counts once
+            'matched_fields': pd.concat([frame['source_field'] for frame in frames.values()]).nunique()
+        }
+
+        st.session_state.result_stats = (results, stats)
+        return stats
+
     @staticmethod
     def _render_algorithm_comparison(results: Dict[str, Any]):
         """Render algorithm performance comparison chart."""
-        algorithms = []
-        counts = []
-        avg_confidences = []
-
-        for match_type in ['exact', 'fuzzy', 'semantic']:
-            matches = results.get(f"{match_type}_matches", [])
-            algorithms.append(match_type.title())
-            counts.append(len(matches))
-
-            if matches:
-                confidences = [m['confidence'] for m in matches]
-                avg_confidences.append(sum(confidences) / len(confidences))
-            else:
-                avg_confidences.append(0)
+        stats = ResultsViewer._get_result_stats(results)
+        algorithms = [match_type.title() for match_type in stats['counts']]
+        counts = list(stats['counts'].values())
+        avg_confidences = list(stats['avg_confidence'].values())
 
         # Create subplot with dual y-axis
         fig = go.Figure()
@@ -454,12 +492,7 @@ class ResultsViewer:
         with col1:
             # Confidence ranges for fuzzy matches
             if results.get('fuzzy_matches'):
-                confidences = [m['confidence'] for m in results['fuzzy_matches']]
-                ranges = {
-                    'High (≥0.8)': sum(1 for c in confidences if c >= 0.8),
-                    'Medium (0.6-0.8)': sum(1 for c in confidences if 0.6 <= c < 0.8),
-                    'Low (<0.6)': sum(1 for c in confidences if c < 0.6)
-                }
+                ranges = ResultsViewer._get_result_stats(results)['fuzzy_confidence_ranges']
 
                 fig = px.pie(
                     values=list(ranges.values()),
@@ -491,11 +524,8 @@ class ResultsViewer:
         """Render coverage analysis."""
         summary = results['summary']
         source_fields = summary['unique_source_fields']
-        total_matches = (summary['total_exact_matches'] +
-                        summary['total_fuzzy_matches'] +
-                        summary['total_semantic_matches'])
 
-        matched_fields = total_matches  # Assuming unique matches
+        matched_fields = ResultsViewer._get_result_stats(results)['matched_fields']
         unmatched_fields = source_fields - matched_fields
 
         coverage_data = {
@@ -0,0 +1,249 @@
+"""
+Cached data loaders for the Streamlit UI.
+
+Streamlit re-executes the whole script on every widget interaction, so file
+loads are memoized here with ``st.cache_data``. Each loader includes the file's
+modification time in its cache key so edited files are picked up on the next rerun.
+For GCS files that time comes from the adapter's prefix listing, which is
+reused for GCS_LISTING_TTL seconds, so cache hits make no per-file request;
+refresh_file_lists() drops the listing to pick up outside changes sooner.
+"""
+
+import streamlit as st
+import pandas as pd
+import os
+import sys
+from typing import Dict, Any, List, Optional, Tuple
+
+# Add path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cde_matcher.core.data_adapter import get_data_adapter
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_csv(path: str, modified_time: float, columns: Optional[Tuple[str, ...]]) -> pd.DataFrame:
+    """Read a CSV file (cache key includes modification time; keeps the 16 most recent)."""
+    return get_data_adapter().read_csv(path, columns=list(columns) if columns is not None else None)
+
+
+@st.cache_data(show_spinner=False)
+def _read_csv_metadata(path: str, modified_time: float, preview_rows: int) -> Dict[str, Any]:
+    """Read CSV structure and preview rows (cache key includes modification time)."""
+    return get_data_adapter().read_csv_metadata(path, preview_rows, include_row_count=False)
+
+
+@st.cache_data(show_spinner="Reading column values...")
+def _read_column_values(path: str, modified_time: float, column: str) -> List[str]:
+    """Stream one CSV column, keeping distinct values in first-seen order."""
+    values = {}
+    for chunk in get_data_adapter().read_csv_chunks(path, columns=[column], dtype=str):
+        values.update(dict.fromkeys(chunk[column].dropna()))
+    return list(values)
+
+
+@st.cache_data(show_spinner="Scanning dataset...")
+def _scan_csv(path: str, modified_time: float, value_columns: Tuple[str, ...]) -> Dict[str, Any]:
+    """Count rows and collect distinct values of the given columns in one chunked pass."""
+    values = {col: {} for col in value_columns}
+    n_rows = 0
+    # Without value columns, stream just the first column to count rows
+    usecols = list(value_columns) or [0]
+    for chunk in get_data_adapter().read_csv_chunks(path, columns=usecols, dtype=str):
+        n_rows += len(chunk)
+        for col in value_columns:
+            values[col].update(dict.fromkeys(chunk[col].dropna()))
+
+    return {
+        'n_rows': n_rows,
+        'column_values': {col: list(col_values) for col, col_values in values.items()}
+    }
+
+
+@st.cache_data(show_spinner="Computing column statistics...")
+def _read_column_stats(path: str, modified_time: float) -> pd.DataFrame:
+    """
+    Compute per-column type, null and unique counts over the full CSV file.
+
+    The file is streamed in chunks, so memory is bounded by one chunk plus the
+    distinct values of each column rather than the whole dataset. Column types
+    are the common type of the per-chunk types, as for a full read.
+    """
+    adapter = get_data_adapter()
+    empty_chunks = []
+    non_null = None
+    distinct = None
+    n_rows = 0
+    for chunk in adapter.read_csv_chunks(path):
+        if distinct is None:
+            non_null = pd.Series(0, index=chunk.columns)
+            distinct = {col: set() for col in chunk.columns}
+        n_rows += len(chunk)
+        non_null += chunk.notna().sum()
+        empty_chunks.append(chunk.iloc[:0])
+        for col in chunk.columns:
+            distinct[col].update(chunk[col].dropna().unique())
+
+    if distinct is None:
+        # Header-only file
+        header = adapter.read_csv(path, nrows=0)
+        empty_chunks = [header]
+        non_null = pd.Series(0, index=header.columns)
+        distinct = {col: set() for col in header.columns}
+
+    dtypes = pd.concat(empty_chunks).dtypes
+    return pd.DataFrame({
+        'Column': dtypes.index,
+        'Type': dtypes.astype(str).values,
+        'Non-null': non_null.values,
+        'Null %': ((1 - non_null / n_rows) * 100).map('{:.1f}%'.format).values,
+        'Unique': [len(distinct[col]) for col in dtypes.index]
+    })
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_json(path: str, modified_time: float) -> Dict[str, Any]:
+    """Read a JSON file (cache key includes modification time; keeps the 8 most recent)."""
+    return get_data_adapter().read_json(path)
+
+
+@st.cache_data(show_spinner=False)
+def _read_json_key(path: str, modified_time: float, key: str) -> Any:
+    """Read one top-level JSON value (cache key includes modification time)."""
+    return get_data_adapter().read_json_key(path, key)
+
+
+@st.cache_data(show_spinner=False, ttl=30)
+def list_files(path: str, pattern: str = "*.csv") -> List[str]:
+    """
+    List files in a directory or GCS prefix, reusing the listing for up to 30 seconds.
+
+    Call refresh_file_lists() after files change so they show up immediately.
+
+    Args:
+        path: Local directory path or GCS bucket path
+        pattern: File pattern to match
+
+    Returns:
+        List of file names
+    """
+    return get_data_adapter().list_files(path, pattern)
+
+
+def refresh_file_lists(path: Optional[str] = None) -> None:
+    """
+    Forget cached file listings, both here and in the data adapter's GCS listing cache.
+
+    Args:
+        path: Directory or GCS prefix whose adapter listings to drop (None for all)
+    """
+    list_files.clear()
+    get_data_adapter().invalidate_listings(path)
+
+
+def load_csv(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load a CSV file from local filesystem or GCS, reusing the parsed DataFrame across reruns.
+
+    Args:
+        path: Local file path or GCS bucket path (gs://bucket/path)
+        columns: Subset of columns to load (None for all columns)
+
+    Returns:
+        DataFrame with loaded data
+    """
+    columns_key = tuple(columns) if columns is not None else None
+    return _read_csv(path, get_data_adapter().get_modified_time(path), columns_key)
+
+
+def load_csv_metadata(path: str, preview_rows: int = 10) -> Dict[str, Any]:
+    """
+    Load CSV structure (columns, dtypes, preview rows) from the leading rows only.
+
+    The row count is left as None; load_csv_scan counts rows.
+
+    Args:
+        path: Local file path or GCS bucket path (gs://bucket/path)
+        preview_rows: Number of leading rows to include as a preview
+
+    Returns:
+        Metadata dictionary as returned by DataAdapter.read_csv_metadata
+    """
+    return _read_csv_metadata(path, get_data_adapter().get_modified_time(path), preview_rows)
+
+
+def load_column_values(path: str, column: str) -> List[str]:
+    """
+    Load the distinct non-null values of one CSV column.
+
+    The file is streamed in chunks, so memory grows with the number of distinct
+    values rather than the number of rows.
+
+    Args:
+        path: Local file path or GCS bucket path (gs://bucket/path)
+        column: Column to read
+
+    Returns:
+        Distinct values as strings, in order of first appearance
+    """
+    return _read_column_values(path, get_data_adapter().get_modified_time(path), column)
+
+
+def load_csv_scan(path: str, value_columns: List[str]) -> Dict[str, Any]:
+    """
+    Count rows and collect distinct column values in a single pass over a CSV file.
+
+    Only the requested columns are parsed, so one scan serves as the row count,
+    the column profile for structure analysis and the value list for extraction.
+
+    Args:
+        path: Local file path or GCS bucket path (gs://bucket/path)
+        value_columns: Columns whose distinct non-null values should be collected
+
+    Returns:
+        Dictionary with 'n_rows' and 'column_values' (column -> distinct values as
+        strings, in order of first appearance)
+    """
+    return _scan_csv(path, get_data_adapter().get_modified_time(path), tuple(value_columns))
+
+
+def load_column_stats(path: str) -> pd.DataFrame:
+    """
+    Load the column information table (type, non-null, null %, unique) for a CSV file.
+
+    The table is computed once per file version; only the small summary frame is
+    kept in the cache, not the full dataset.
+
+    Args:
+        path: Local file path or GCS bucket path (gs://bucket/path)
+
+    Returns:
+        DataFrame with one row per column
+    """
+    return _read_column_stats(path, get_data_adapter().get_modified_time(path))
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    """
+    Load a JSON file from local filesystem or GCS, reusing the parsed data across reruns.
+
+    Args:
+        path: Local file path or GCS bucket path (gs://bucket/path)
+
+    Returns:
+        Dictionary with loaded data
+    """
+    return _read_json(path, get_data_adapter().get_modified_time(path))
+
+
+def load_json_key(path: str, key: str) -> Any:
+    """
+    Load a single top-level value of a JSON file without keeping the rest of it.
+
+    Args:
+        path: Local file path or GCS bucket path (gs://bucket/path)
+        key: Top-level key to read
+
+    Returns:
+        The value stored under key
+    """
+    return _read_json_key(path, get_data_adapter().get_modified_time(path), key)